@@ -0,0 +1,59 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+from fastdf import fdf
+
+ROWS = int(os.environ.get('FASTDF_BENCH_ROWS', 1_000_000))
+COLS = int(os.environ.get('FASTDF_BENCH_COLS', 10))
+
+READERS = {
+    'pd.read_csv + from_pandas': lambda csv, raw, names: fdf.from_pandas(pd.read_csv(csv)),
+    'fdf.read_csv': lambda csv, raw, names: fdf.read_csv(csv),
+    'fdf.read_csv(iterator=True)': lambda csv, raw, names: sum(len(chunk) for chunk in fdf.read_csv(csv, iterator=True)),
+    'fdf.read_binary': lambda csv, raw, names: fdf.read_binary(raw, names),
+}
+
+
+def peak_rss_mb():
+    # VmHWM starts over with every new process image, unlike ru_maxrss, which survives fork and exec.
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmHWM:'):
+                return int(line.split()[1]) / 1024
+
+
+def run(name, csv, raw):
+    # Runs in a fresh process, so the high-water mark belongs to this reader alone (Linux only).
+    names = [f'col_{i}' for i in range(COLS)]
+    before = peak_rss_mb()
+    start = time.perf_counter()
+    READERS[name](csv, raw, names)
+    elapsed = time.perf_counter() - start
+    print(f"{elapsed} {peak_rss_mb() - before}")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        csv = os.path.join(directory, 'data.csv')
+        raw = os.path.join(directory, 'data.bin')
+        data = np.random.rand(ROWS, COLS)
+        pd.DataFrame(data, columns=[f'col_{i}' for i in range(COLS)]).to_csv(csv, index=False)
+        data.tofile(raw)
+        print(f"{ROWS} rows x {COLS} columns, CSV {os.path.getsize(csv) / 1e6:.0f} MB, "
+              f"result {data.nbytes / 1e6:.0f} MB")
+        print(f"{'reader':30}{'time':>10}{'peak RSS growth':>18}")
+        for name in READERS:
+            output = subprocess.run([sys.executable, __file__, name, csv, raw], capture_output=True, text=True,
+                                    check=True).stdout.split()
+            print(f"{name:30}{float(output[0]):>9.2f}s{float(output[1]):>15.0f}MB")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 4:
+        run(*sys.argv[1:])
+    else:
+        main()
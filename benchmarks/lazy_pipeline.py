@@ -0,0 +1,50 @@
+import os
+import time
+import tracemalloc
+import numpy as np
+from fastdf import fdf
+
+ROWS = int(os.environ.get('FASTDF_BENCH_ROWS', 2_000_000))
+COLS = int(os.environ.get('FASTDF_BENCH_COLS', 20))
+REPEATS = 3
+
+PIPELINES = [
+    ('shift(1).fillna(0).mean()',
+     lambda df: df.shift(1).fillna(0).mean(),
+     lambda df: df.lazy().shift(1).fillna(0).mean().collect()),
+    ('shift(-2).dropna().sum()',
+     lambda df: df.shift(-2).dropna().sum(),
+     lambda df: df.lazy().shift(-2).dropna().sum().collect()),
+    ('shift(1).loc[1000:50000].max()',
+     lambda df: df.shift(1).loc[1000:50000].max(),
+     lambda df: df.lazy().shift(1).loc[1000:50000].max().collect()),
+]
+
+
+def measure(func, frame):
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(frame)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func(frame)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    data = np.random.rand(ROWS, COLS)
+    data[::13, 0] = np.nan
+    frame = fdf(data, [f'col_{i}' for i in range(COLS)])
+    print(f"{ROWS} rows x {COLS} columns")
+    print(f"{'pipeline':34}{'eager':>10}{'peak':>11}{'lazy':>10}{'peak':>11}")
+    for name, eager, lazy in PIPELINES:
+        eager_time, eager_peak = measure(eager, frame)
+        lazy_time, lazy_peak = measure(lazy, frame)
+        print(f"{name:34}{eager_time:>9.3f}s{eager_peak / 1e6:>9.1f}MB{lazy_time:>9.3f}s{lazy_peak / 1e6:>9.1f}MB")
+
+
+if __name__ == '__main__':
+    main()
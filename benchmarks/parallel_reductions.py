@@ -0,0 +1,34 @@
+import os
+import time
+import numpy as np
+from fastdf import fdf
+
+ROWS = int(os.environ.get('FASTDF_BENCH_ROWS', 5_000_000))
+COLS = int(os.environ.get('FASTDF_BENCH_COLS', 20))
+REPEATS = 3
+
+
+def best_time(func):
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    data = np.random.rand(ROWS, COLS)
+    data[::97, 0] = np.nan
+    frame = fdf(data, [f'col_{i}' for i in range(COLS)])
+    worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    print(f"{ROWS} rows x {COLS} columns, {os.cpu_count()} CPUs")
+    print(f"{'op':6}" + "".join(f"{f'{w} workers':>14}" for w in worker_counts))
+    for name in ['mean', 'sum', 'min', 'max', 'any']:
+        times = [best_time(lambda: getattr(frame, name)(workers=workers)) for workers in worker_counts]
+        cells = "".join(f"{t:>9.4f}s {times[0] / t:>3.1f}x" for t in times)
+        print(f"{name:6}{cells}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+import os
+import time
+import tracemalloc
+import numpy as np
+from fastdf import fdf, set_option
+
+ROWS = int(os.environ.get('FASTDF_BENCH_ROWS', 1_000_000))
+COLS = int(os.environ.get('FASTDF_BENCH_COLS', 8))
+
+
+def scan(frame):
+    for i in range(len(frame)):
+        frame.loc[i]['col_1']
+
+
+def scan_iterrows(frame):
+    for row in frame.iterrows(batch_size=4096):
+        row['col_1']
+
+
+def measure(name, func):
+    frame = fdf(np.random.rand(ROWS, COLS), [f'col_{i}' for i in range(COLS)])
+    start = time.perf_counter()
+    func(frame)
+    elapsed = time.perf_counter() - start
+    # Memory is traced in a second pass, since tracing slows every allocation down.
+    frame = fdf(np.random.rand(ROWS, COLS), [f'col_{i}' for i in range(COLS)])
+    tracemalloc.start()
+    func(frame)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:24}{elapsed:>9.2f}s{current / 1e6:>12.1f}MB{peak / 1e6:>12.1f}MB")
+
+
+def main():
+    print(f"Full scan of {ROWS} rows x {COLS} columns")
+    print(f"{'':24}{'time':>10}{'retained':>14}{'peak':>14}")
+    set_option('row_cache_size', None)
+    measure('loc[i], unbounded cache', scan)
+    set_option('row_cache_size', 4096)
+    measure('loc[i], 4096 rows', scan)
+    measure('iterrows()', scan_iterrows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+from fastdf import fdf
+
+COLS = 20
+ACCESSES = 10_000
+SLICES = 1_000
+
+
+def row_access(df, positions, column):
+    if isinstance(df, pd.DataFrame):
+        position = df.columns.get_loc(column)
+        for i in positions:
+            df.iat[i, position]
+    else:
+        for i in positions:
+            df.loc[i][column]
+
+
+def loc_slicing(df, starts):
+    for start in starts:
+        df.loc[start:start + 99]
+
+
+# Each entry is (name, operation); the operation takes (frame, inputs) and runs on either library.
+OPERATIONS = [
+    ('row access', lambda df, inputs: row_access(df, inputs['positions'], 'col_1')),
+    ('loc slicing', lambda df, inputs: loc_slicing(df, inputs['starts'])),
+    ('shift', lambda df, inputs: df.shift(1)),
+    ('fillna', lambda df, inputs: df.fillna(0.0)),
+    ('dropna', lambda df, inputs: df.dropna()),
+    ('mean', lambda df, inputs: df.mean()),
+    ('sum', lambda df, inputs: df.sum()),
+    ('column assignment', lambda df, inputs: df.__setitem__('col_0', inputs['column'])),
+]
+
+
+def measure(func, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def run(sizes, repeats, seed):
+    rng = np.random.default_rng(seed)
+    results = {}
+    for rows in sizes:
+        data = rng.random((rows, COLS))
+        data[rng.random((rows, COLS)) < 0.05] = np.nan
+        columns = [f'col_{i}' for i in range(COLS)]
+        frames = {'fastdf': fdf(data.copy(), columns), 'pandas': pd.DataFrame(data.copy(), columns=columns)}
+        inputs = {
+            'positions': rng.integers(0, rows, ACCESSES).tolist(),
+            'starts': rng.integers(0, max(rows - 100, 1), SLICES).tolist(),
+            'column': rng.random(rows),
+        }
+        for name, operation in OPERATIONS:
+            entry = {}
+            for library, frame in frames.items():
+                seconds, peak = measure(lambda: operation(frame, inputs), repeats)
+                entry[library] = {'seconds': seconds, 'peak_bytes': peak}
+            results[f'{name}@{rows}'] = entry
+    return results
+
+
+def report(results):
+    print(f"{'operation':28}{'fastdf':>11}{'pandas':>11}{'speedup':>9}{'fastdf peak':>14}{'pandas peak':>14}")
+    for key, entry in results.items():
+        fast, slow = entry['fastdf'], entry['pandas']
+        print(f"{key:28}{fast['seconds']:>10.4f}s{slow['seconds']:>10.4f}s{slow['seconds'] / fast['seconds']:>8.1f}x"
+              f"{fast['peak_bytes'] / 1e6:>12.1f}MB{slow['peak_bytes'] / 1e6:>12.1f}MB")
+
+
+def regressions(results, baseline, threshold, min_speedup):
+    failures = []
+    for key, entry in results.items():
+        fast = entry['fastdf']
+        previous = baseline.get(key, {}).get('fastdf')
+        if previous is not None:
+            if fast['seconds'] > previous['seconds'] * threshold:
+                failures.append(f"{key}: {fast['seconds']:.4f}s vs {previous['seconds']:.4f}s in the baseline")
+            # Small allocations are noise; only flag growth beyond 1 MB.
+            if fast['peak_bytes'] > max(previous['peak_bytes'] * threshold, previous['peak_bytes'] + (1 << 20)):
+                failures.append(f"{key}: peak {fast['peak_bytes']} bytes vs {previous['peak_bytes']} in the baseline")
+        if min_speedup is not None and entry['pandas']['seconds'] < fast['seconds'] * min_speedup:
+            failures.append(f"{key}: only {entry['pandas']['seconds'] / fast['seconds']:.2f}x faster than pandas")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare fastdf with pandas across frame sizes.")
+    parser.add_argument('--sizes', default='10000,100000,1000000', help="comma-separated row counts")
+    parser.add_argument('--repeats', type=int, default=5, help="timing runs per operation; the best is kept")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--save', metavar='FILE', help="write the results as JSON, e.g. to use as a baseline")
+    parser.add_argument('--baseline', metavar='FILE', help="fail if any operation regressed against these results")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="allowed slowdown or memory growth against the baseline (default 1.25)")
+    parser.add_argument('--min-speedup', type=float, help="fail if fastdf is not at least this much faster than pandas")
+    args = parser.parse_args()
+
+    results = run([int(size) for size in args.sizes.split(',')], args.repeats, args.seed)
+    report(results)
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    failures = regressions(results, baseline, args.threshold, args.min_speedup)
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
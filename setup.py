@@ -34,5 +34,6 @@ setup(
     ],
     extras_require={
         "dev": ["pytest>=6.0", "pytest-cov", "black", "isort"],
+        "arrow": ["pyarrow>=10.0"],
     },
 )
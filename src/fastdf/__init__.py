@@ -1,4 +1,4 @@
-from .core import FastDataFrame as fdf
+from .core import FastDataFrame as fdf, options, set_option
 
-__all__ = ['fdf']
+__all__ = ['fdf', 'options', 'set_option']
 __version__ = '0.1.3'
@@ -1,9 +1,58 @@
 import pandas as pd
 import numpy as np
+import functools
+import threading
 import time
-from typing import List, Dict, Union, Any
+from collections import OrderedDict
+from typing import List, Dict, Tuple, Union, Any, Optional
+from . import interop, parallel, readers, stats, storage, utils
+from .groupby import GroupBy, Grouping
+from .lazy import LazyFrame
+from .window import Rolling, Expanding
+
+_MIN_CAPACITY = 16
+_STATS_REDUCTIONS = {np.nansum: 'sum', np.nanmean: 'mean', np.nanmin: 'min', np.nanmax: 'max'}
+
+options = {
+    'workers': 1,
+    'chunk_bytes': 1 << 20,
+    # Rows kept by each .loc indexer; the oldest are evicted first. None means unbounded.
+    'row_cache_size': 4096,
+    # Record calls, time and copies of the public operations; see get_profile().
+    'profile': False,
+}
+
+def set_option(name: str, value: Any) -> None:
+    if name not in options:
+        raise KeyError(f"Unknown option '{name}'")
+    if name == 'workers' and value < 1:
+        raise ValueError("workers must be >= 1")
+    if name == 'row_cache_size' and value is not None and value < 0:
+        raise ValueError("row_cache_size must be >= 0 or None")
+    options[name] = value
+    if name == 'profile':
+        _set_profiling(bool(value))
+
+def _check_sorted(values: np.ndarray) -> None:
+    if len(values) > 1 and np.any(values[1:] < values[:-1]):
+        raise ValueError("Index must be sorted in ascending order")
+
+def _with_missing(values: np.ndarray, missing: np.ndarray) -> np.ndarray:
+    if not missing.any():
+        return values
+    if values.dtype.kind in 'iub':
+        values = values.astype(np.float64)
+    elif values.dtype.kind not in 'fcmMO':
+        values = values.astype(object)
+    if values.dtype.kind in 'mM':
+        values[missing] = values.dtype.type('NaT', np.datetime_data(values.dtype)[0])
+    else:
+        values[missing] = np.nan
+    return values
 
 class FastRow:
+    __slots__ = ('data', 'column_indices')
+
     def __init__(self, data: np.ndarray, column_indices: Dict[str, int]):
         self.data = data
         self.column_indices = column_indices
@@ -11,28 +60,91 @@ class FastRow:
     def __getitem__(self, key: str) -> Any:
         return self.data[self.column_indices[key]]
 
+class BlockRow(FastRow):
+    __slots__ = ('rows', 'column_locs')
+
+    def __init__(self, rows: List[np.ndarray], column_locs: Dict[str, Tuple[int, int]], column_indices: Dict[str, int]):
+        self.rows = rows
+        self.column_locs = column_locs
+        self.column_indices = column_indices
+
+    def __getitem__(self, key: str) -> Any:
+        block, col = self.column_locs[key]
+        return self.rows[block][col]
+
+    @property
+    def data(self) -> np.ndarray:
+        result = np.empty(len(self.column_indices), dtype=utils.common_dtype([row.dtype for row in self.rows]))
+        rows = [utils.to_object(row) for row in self.rows] if result.dtype == object else self.rows
+        for name, (block, col) in self.column_locs.items():
+            result[self.column_indices[name]] = rows[block][col]
+        return result
+
 class LocIndexer:
     def __init__(self, obj: 'FastDataFrameView'):
         self.obj = obj
-        self._row_cache = {}
+        self._row_cache = OrderedDict()
         self._col_cache = {}
 
-    def __getitem__(self, key: Union[int, slice, str]) -> Union[np.ndarray, 'FastRow', 'FastDataFrameView']:
-        if isinstance(key, int):
-            return self._get_row(key)
+    def __getitem__(self, key: Union[int, slice, str, List[int], np.ndarray, Tuple]) -> Union[np.ndarray, 'FastRow', 'FastDataFrameView']:
+        if isinstance(key, str):
+            return self._get_column(key)
+        elif isinstance(key, tuple):
+            return self._get_cells(key)
+        return self._get_rows(key)
+
+    def _get_rows(self, key) -> Union['FastRow', 'FastDataFrameView']:
+        if self.obj._index is not None:
+            return self._get_labels(key)
+        elif isinstance(key, (int, np.integer)):
+            return self._get_row(int(key))
         elif isinstance(key, slice):
             return self._get_slice(key)
-        elif isinstance(key, str):
-            return self._get_column(key)
         else:
-            return self.obj.data[self.obj.start:self.obj.stop][key]
+            # Positions or a boolean mask: one fancy-index gather per block.
+            return self.obj._take(key)
+
+    def _get_cells(self, key: Tuple) -> Union[Any, np.ndarray, 'FastRow', 'FastDataFrameView']:
+        # loc[rows, column] and loc[rows, [columns]], where columns are given by name or position.
+        if len(key) != 2:
+            raise TypeError("loc takes rows or a (rows, columns) pair")
+        rows, columns = key
+        if isinstance(columns, list):
+            names = [self._column_name(column) for column in columns]
+            if isinstance(rows, (slice, list, np.ndarray)):
+                return self._get_rows(rows)._select(names)
+            return self._get_rows([rows])._select(names).loc._get_row(0)
+        return self._get_rows(rows)[self._column_name(columns)]
+
+    def _column_name(self, column: Union[str, int]) -> str:
+        if isinstance(column, str):
+            return column
+        elif isinstance(column, (int, np.integer)):
+            return self.obj.column_names[column]
+        raise TypeError(f"Columns must be given by name or position, not {type(column).__name__}")
+
+    def _get_labels(self, key) -> Union['FastRow', 'FastDataFrameView']:
+        if isinstance(key, slice):
+            index = self.obj._row_index()
+            start = 0 if key.start is None else int(np.searchsorted(index, self.obj._labels(key.start), 'left'))
+            stop = len(index) if key.stop is None else int(np.searchsorted(index, self.obj._labels(key.stop), 'right'))
+            return self.obj._view(self.obj.start + start, self.obj.start + max(start, stop))
+        elif isinstance(key, (list, np.ndarray)):
+            return self.obj._take(self.obj._positions(key))
+        return self._get_row(int(self.obj._positions([key])[0]))
 
     def _get_row(self, key: int) -> 'FastRow':
         absolute_key = self.obj.start + key if key >= 0 else self.obj.stop + key
         if self.obj.start <= absolute_key < self.obj.stop:
-            if absolute_key not in self._row_cache:
-                self._row_cache[absolute_key] = FastRow(self.obj.data[absolute_key], self.obj.column_indices)
-            return self._row_cache[absolute_key]
+            row = self._row_cache.get(absolute_key)
+            if row is None:
+                row = self.obj._row(absolute_key)
+                limit = options['row_cache_size']
+                if limit is None or limit > 0:
+                    if limit is not None and len(self._row_cache) >= limit:
+                        self._row_cache.popitem(last=False)
+                    self._row_cache[absolute_key] = row
+            return row
         raise IndexError("FastDataFrame index out of range")
 
     def _get_slice(self, key: slice) -> 'FastDataFrameView':
@@ -40,113 +152,445 @@ class LocIndexer:
         stop = self.obj.stop if key.stop is None else (self.obj.start + key.stop + 1 if key.stop >= 0 else self.obj.stop + key.stop + 1)
         start = max(self.obj.start, min(start, self.obj.stop))
         stop = max(start, min(stop, self.obj.stop))
-        return FastDataFrameView(self.obj.data, self.obj.column_names, self.obj.column_indices, start, stop)
+        return self.obj._view(start, stop)
 
     def _get_column(self, key: str) -> np.ndarray:
         if key not in self._col_cache:
-            self._col_cache[key] = self.obj.column_indices[key]
-        col_index = self._col_cache[key]
-        return self.obj.data[self.obj.start:self.obj.stop, col_index]
+            self._col_cache[key] = self.obj._locate(key)
+        block, col = self._col_cache[key]
+        return self.obj.blocks[block][self.obj.start:self.obj.stop, col]
 
 class FastDataFrameView:
-    def __init__(self, data: np.ndarray, column_names: List[str], column_indices: Dict[str, int], start: int, stop: int):
-        self.data = data
+    def __init__(self, data: Optional[np.ndarray], column_names: List[str], column_indices: Dict[str, int], start: int, stop: int,
+                 blocks: Optional[List[np.ndarray]] = None, column_locs: Optional[Dict[str, Tuple[int, int]]] = None,
+                 index: Optional[np.ndarray] = None, index_name: Optional[str] = None):
+        # Columns live in same-dtype 2D blocks. column_locs maps a name to (block, column in block);
+        # None means a single block holding every column in order, which is the common fast path.
+        self.blocks = [data] if blocks is None else blocks
+        self.column_locs = column_locs
+        # Sorted row labels aligned with the blocks, so start/stop apply to them as well.
+        self._index = index
+        self.index_name = index_name
+        # Derived data (e.g. group factorizations) keyed by (kind, column, ...). Slices of the same
+        # storage share one dict, so the owning frame can invalidate entries when a column changes.
+        self._cache = {}
+        # Opt-in per-column prefix sums and zone maps for range reductions, kept in _cache as ('stats', column).
+        self._stats = False
         self.column_names = column_names
         self.column_indices = column_indices
         self.start = start
         self.stop = stop
         self._loc = None
+        # The frame whose buffers these blocks point into, so exports can mark the memory as shared.
+        self._owner = None
+
+    @property
+    def data(self) -> np.ndarray:
+        if self.column_locs is None:
+            return self.blocks[0]
+        return self._consolidate(0, len(self.blocks[0]) if self.blocks else 0)
+
+    @property
+    def values(self) -> np.ndarray:
+        if self.column_locs is None:
+            return self.blocks[0][self.start:self.stop]
+        return self._consolidate(self.start, self.stop)
+
+    @property
+    def index(self) -> Optional[np.ndarray]:
+        if self._index is None:
+            return None
+        return self._index[self.start:self.stop]
+
+    @property
+    def dtypes(self) -> Dict[str, np.dtype]:
+        return {name: self.blocks[self._locate(name)[0]].dtype for name in self.column_names}
+
+    def _locate(self, key: str) -> Tuple[int, int]:
+        if self.column_locs is None:
+            return 0, self.column_indices[key]
+        return self.column_locs[key]
+
+    def _column(self, key: str) -> np.ndarray:
+        block, col = self._locate(key)
+        return self.blocks[block][self.start:self.stop, col]
+
+    def _block_positions(self) -> List[np.ndarray]:
+        if self.column_locs is None:
+            return [np.arange(len(self.column_names))]
+        positions = [np.empty(block.shape[1], dtype=np.intp) for block in self.blocks]
+        for name, (block, col) in self.column_locs.items():
+            positions[block][col] = self.column_indices[name]
+        return positions
+
+    def _consolidate(self, start: int, stop: int) -> np.ndarray:
+        result = np.empty((stop - start, len(self.column_names)), dtype=utils.common_dtype([block.dtype for block in self.blocks]))
+        for block, positions in zip(self.blocks, self._block_positions()):
+            result[:, positions] = utils.to_object(block[start:stop]) if result.dtype == object else block[start:stop]
+        return result
+
+    def _scatter(self, parts: List[np.ndarray]) -> np.ndarray:
+        result = np.empty(len(self.column_names), dtype=utils.common_dtype([part.dtype for part in parts]))
+        for part, positions in zip(parts, self._block_positions()):
+            result[positions] = utils.to_object(part) if result.dtype == object else part
+        return result
+
+    def _row_index(self, key=None) -> Optional[np.ndarray]:
+        if self._index is None:
+            return None
+        index = self._index[self.start:self.stop]
+        return index if key is None else index[key]
+
+    def _require_index(self) -> np.ndarray:
+        if self._index is None:
+            raise ValueError("This operation requires an index; call set_index first")
+        return self._row_index()
+
+    def _labels(self, labels) -> np.ndarray:
+        if self._index.dtype.kind in 'mM':
+            return np.asarray(labels, dtype=self._index.dtype)
+        return np.asarray(labels)
+
+    def _positions(self, labels) -> np.ndarray:
+        index = self._require_index()
+        labels = self._labels(labels)
+        positions = np.searchsorted(index, labels, 'left')
+        found = positions < len(index)
+        found[found] = index[positions[found]] == labels[found]
+        if not found.all():
+            raise KeyError(f"{labels[~found].tolist()} not in index")
+        return positions
+
+    def _view(self, start: int, stop: int) -> 'FastDataFrameView':
+        view = FastDataFrameView(None, self.column_names, self.column_indices, start, stop, self.blocks, self.column_locs,
+                                 self._index, self.index_name)
+        view._cache = self._cache
+        view._stats = self._stats
+        view._owner = self if isinstance(self, FastDataFrame) else self._owner
+        return view
+
+    def _share(self, arrays: List[np.ndarray]) -> None:
+        # Called for memory handed out without a copy; the frame copies it before its next write.
+        frame = self if isinstance(self, FastDataFrame) else self._owner
+        if frame is not None:
+            frame._disown(arrays)
+
+    def _invalidate(self, column: Optional[str] = None) -> None:
+        if column is None:
+            self._cache.clear()
+            return
+        for key in [key for key in self._cache if key[1] == column]:
+            del self._cache[key]
+
+    def _row(self, position: int) -> FastRow:
+        # position is absolute, like start and stop.
+        if self.column_locs is None:
+            return FastRow(self.blocks[0][position], self.column_indices)
+        return BlockRow([block[position] for block in self.blocks], self.column_locs, self.column_indices)
+
+    def iterrows(self, batch_size: int = 1024):
+        # Rows are sliced out of each block a batch at a time and never cached, so a full scan
+        # holds on to at most one batch.
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        for start in range(self.start, self.stop, batch_size):
+            stop = min(start + batch_size, self.stop)
+            if self.column_locs is None:
+                for values in self.blocks[0][start:stop]:
+                    yield FastRow(values, self.column_indices)
+            else:
+                batches = [block[start:stop] for block in self.blocks]
+                for i in range(stop - start):
+                    yield BlockRow([batch[i] for batch in batches], self.column_locs, self.column_indices)
+
+    def _take(self, key) -> 'FastDataFrameView':
+        blocks = [block[self.start:self.stop][key] for block in self.blocks]
+        return FastDataFrameView(None, self.column_names, self.column_indices, 0, len(blocks[0]), blocks, self.column_locs,
+                                 self._row_index(key), self.index_name)
+
+    def _select(self, names: List[str]) -> 'FastDataFrameView':
+        column_indices = {name: i for i, name in enumerate(names)}
+        if self.column_locs is None:
+            data = self.values[:, [self.column_indices[name] for name in names]]
+            return FastDataFrameView(data, names, column_indices, 0, len(data), index=self._row_index(), index_name=self.index_name)
+        selected = {}
+        for name in names:
+            block, col = self.column_locs[name]
+            selected.setdefault(block, []).append((name, col))
+        blocks = []
+        column_locs = {}
+        for block, columns in selected.items():
+            blocks.append(self.blocks[block][self.start:self.stop, [col for _, col in columns]])
+            for i, (name, _) in enumerate(columns):
+                column_locs[name] = (len(blocks) - 1, i)
+        if len(blocks) <= 1:
+            # A single remaining block already holds the columns in the requested order.
+            data = blocks[0] if blocks else np.empty((len(self), 0))
+            return FastDataFrameView(data, names, column_indices, 0, len(self), index=self._row_index(), index_name=self.index_name)
+        return FastDataFrameView(None, names, column_indices, 0, len(self), blocks, column_locs, self._row_index(), self.index_name)
+
+    def _reduce(self, func, axis, workers: Optional[int] = None):
+        workers = options['workers'] if workers is None else workers
+        if axis is None or axis == 0:
+            if self._stats and func in _STATS_REDUCTIONS and len(self) and self._stats_current():
+                return self._reduce_stats(func)
+            if self.column_locs is None:
+                return self._reduce_block(func, self.blocks[0][self.start:self.stop], workers)
+            return self._scatter([self._reduce_block(func, block[self.start:self.stop], workers) for block in self.blocks])
+        elif axis == 1:
+            values = self.values
+            if workers > 1 and parallel.supports(func, values.dtype) and values.nbytes > options['chunk_bytes']:
+                return parallel.reduce_rows(func, values, workers, options['chunk_bytes'])
+            return func(values, axis=1)
+        else:
+            raise ValueError("Axis must be 0, 1 or None")
+
+    def _stats_current(self) -> bool:
+        # A view left behind by a reallocation still sees the old buffers, so statistics built from
+        # them would not describe the frame that shares its cache.
+        return self._owner is None or self._owner.blocks is self.blocks
+
+    def _column_stats(self, name: str, column: np.ndarray) -> stats.ColumnStats:
+        cache_key = ('stats', name)
+        column_stats = self._cache.get(cache_key)
+        if column_stats is None or column_stats.rows < self.stop:
+            column_stats = stats.ColumnStats(column)
+            self._cache[cache_key] = column_stats
+        return column_stats
+
+    def _reduce_stats(self, func):
+        how = _STATS_REDUCTIONS[func]
+        parts = []
+        for block, positions in zip(self.blocks, self._block_positions()):
+            if not stats.supports(block.dtype):
+                parts.append(self._reduce_block(func, block[self.start:self.stop], 1))
+                continue
+            results = []
+            for col, position in enumerate(positions):
+                column = block[:, col]
+                column_stats = self._column_stats(self.column_names[position], column)
+                results.append(getattr(column_stats, how)(column, self.start, self.stop))
+            if how == 'sum':
+                dtype = np.nansum(block[:0], axis=0).dtype
+            elif how == 'mean':
+                dtype = block.dtype if block.dtype.kind == 'f' else np.float64
+            else:
+                dtype = block.dtype
+            parts.append(np.array(results, dtype=dtype))
+        return parts[0] if self.column_locs is None else self._scatter(parts)
+
+    @staticmethod
+    def _reduce_block(func, data: np.ndarray, workers: int):
+        if workers > 1 and parallel.supports(func, data.dtype) and data.nbytes > options['chunk_bytes']:
+            return parallel.reduce_columns(func, data, workers, options['chunk_bytes'])
+        return func(data, axis=0)
 
     def __getitem__(self, key):
         if isinstance(key, str):
-            return self.data[self.start:self.stop, self.column_indices[key]]
+            return self._column(key)
+        elif isinstance(key, list) and key and all(isinstance(name, str) for name in key):
+            return self._select(key)
         elif isinstance(key, int):
-            return self.data[self.start + key]
-        return FastDataFrameView(self.data[self.start:self.stop][key], self.column_names, self.column_indices, 0, len(self.data[self.start:self.stop][key]))
+            if self.column_locs is None:
+                return self.blocks[0][self.start + key]
+            return self._consolidate(self.start + key, self.start + key + 1)[0]
+        return self._take(key)
 
     def __len__(self) -> int:
         return self.stop - self.start
 
+    def _like(self, data: np.ndarray) -> 'FastDataFrameView':
+        return FastDataFrameView(data, self.column_names, self.column_indices, 0, len(data),
+                                 index=self._row_index(), index_name=self.index_name)
+
     def __str__(self) -> str:
         return self.__repr__()
 
     def __repr__(self) -> str:
         rows = min(5, len(self))
-        col_width = max(max(len(str(x)) for x in col[self.start:self.stop]) for col in self.data.T)
+        col_width = max(max(len(str(x)) for x in self._column(name)) for name in self.column_names)
         result = []
-        for i, name in enumerate(self.column_names):
-            col_data = self.data[self.start:self.stop, i]
+        for name in self.column_names:
+            col_data = self._column(name)
             col_str = f"{name:>{col_width}}"
             for j in range(rows):
-                col_str += f"\n{col_data[j]:>{col_width}.6f}"
+                if col_data.dtype.kind in 'iuf':
+                    col_str += f"\n{col_data[j]:>{col_width}.6f}"
+                else:
+                    col_str += f"\n{str(col_data[j]):>{col_width}}"
             if len(col_data) > rows:
                 col_str += f"\n{'...':>{col_width}}"
             result.append(col_str)
         return "  ".join(result)
 
     def shift(self, periods: int = 1, fill_value=None) -> 'FastDataFrameView':
-        shifted_data = np.empty_like(self.data[self.start:self.stop])
-        if periods > 0:
-            shifted_data[:periods] = fill_value if fill_value is not None else np.nan
-            shifted_data[periods:] = self.data[self.start:self.stop-periods]
-        elif periods < 0:
-            shifted_data[periods:] = fill_value if fill_value is not None else np.nan
-            shifted_data[:periods] = self.data[self.start-periods:self.stop]
-        else:
-            shifted_data[:] = self.data[self.start:self.stop]
-        return FastDataFrameView(shifted_data, self.column_names, self.column_indices, 0, len(shifted_data))
-
-    def mean(self, axis=None):
-        if axis is None:
-            return np.nanmean(self.data[self.start:self.stop], axis=0)
-        elif axis == 0 or axis == 1:
-            return np.nanmean(self.data[self.start:self.stop], axis=axis)
-        else:
-            raise ValueError("Axis must be 0, 1 or None")
+        # Block by block, so columns keep their dtype unless the fill value needs a wider one,
+        # e.g. NaN turns an int block into float64 while a datetime block is filled with NaT.
+        blocks = []
+        for block in self.blocks:
+            values = block[self.start:self.stop]
+            if periods == 0:
+                blocks.append(values.copy())
+                continue
+            fill = utils.fill_value(values.dtype, fill_value)
+            shifted_data = np.empty_like(values, dtype=utils.shifted_dtype(values.dtype, fill))
+            if periods > 0:
+                shifted_data[:periods] = fill
+                shifted_data[periods:] = values[:-periods]
+            else:
+                shifted_data[periods:] = fill
+                shifted_data[:periods] = values[-periods:]
+            blocks.append(shifted_data)
+        return FastDataFrameView(None, self.column_names, self.column_indices, 0, len(self), blocks, self.column_locs,
+                                 self._row_index(), self.index_name)
 
-    def sum(self, axis=None):
-        if axis is None:
-            return np.nansum(self.data[self.start:self.stop], axis=0)
-        elif axis == 0 or axis == 1:
-            return np.nansum(self.data[self.start:self.stop], axis=axis)
-        else:
-            raise ValueError("Axis must be 0, 1 or None")
+    def mean(self, axis=None, workers: Optional[int] = None):
+        return self._reduce(np.nanmean, axis, workers)
 
-    def min(self, axis=None):
-        if axis is None:
-            return np.nanmin(self.data[self.start:self.stop], axis=0)
-        elif axis == 0 or axis == 1:
-            return np.nanmin(self.data[self.start:self.stop], axis=axis)
-        else:
-            raise ValueError("Axis must be 0, 1 or None")
+    def sum(self, axis=None, workers: Optional[int] = None):
+        return self._reduce(np.nansum, axis, workers)
 
-    def max(self, axis=None):
-        if axis is None:
-            return np.nanmax(self.data[self.start:self.stop], axis=0)
-        elif axis == 0 or axis == 1:
-            return np.nanmax(self.data[self.start:self.stop], axis=axis)
-        else:
-            raise ValueError("Axis must be 0, 1 or None")
+    def min(self, axis=None, workers: Optional[int] = None):
+        return self._reduce(np.nanmin, axis, workers)
+
+    def max(self, axis=None, workers: Optional[int] = None):
+        return self._reduce(np.nanmax, axis, workers)
 
     def isna(self):
-        return np.isnan(self.data[self.start:self.stop])
+        if self.column_locs is None:
+            return utils.isna(self.values)
+        result = np.empty((len(self), len(self.column_names)), dtype=bool)
+        for block, positions in zip(self.blocks, self._block_positions()):
+            result[:, positions] = utils.isna(block[self.start:self.stop])
+        return result
 
     def fillna(self, value):
-        filled_data = np.where(np.isnan(self.data[self.start:self.stop]), value, self.data[self.start:self.stop])
-        return FastDataFrameView(filled_data, self.column_names, self.column_indices, 0, len(filled_data))
+        if self.column_locs is None:
+            filled_data = np.where(utils.isna(self.values), value, self.values)
+            return self._like(filled_data)
+        blocks = []
+        for block in self.blocks:
+            block = block[self.start:self.stop]
+            mask = utils.isna(block)
+            blocks.append(np.where(mask, value, block) if mask.any() else block.copy())
+        return FastDataFrameView(None, self.column_names, self.column_indices, 0, len(self), blocks, self.column_locs,
+                                 self._row_index(), self.index_name)
 
     def dropna(self, axis=0):
         if axis == 0:
-            mask = ~np.isnan(self.data[self.start:self.stop]).any(axis=1)
-            return FastDataFrameView(self.data[self.start:self.stop][mask], self.column_names, self.column_indices, 0, np.sum(mask))
+            mask = ~self.isna().any(axis=1)
+            return self._take(mask)
         elif axis == 1:
-            mask = ~np.isnan(self.data[self.start:self.stop]).any(axis=0)
-            new_column_names = [name for name, keep in zip(self.column_names, mask) if keep]
-            new_column_indices = {name: i for i, name in enumerate(new_column_names)}
-            return FastDataFrameView(self.data[self.start:self.stop][:, mask], new_column_names, new_column_indices, 0, self.stop - self.start)
+            mask = ~self.isna().any(axis=0)
+            return self._select([name for name, keep in zip(self.column_names, mask) if keep])
+
+    def any(self, axis: int = 0, workers: Optional[int] = None) -> np.ndarray:
+        return self._reduce(np.any, axis, workers)
+
+    def rolling(self, window: int, min_periods: Optional[int] = None) -> Rolling:
+        if not isinstance(window, (int, np.integer)) or window < 1:
+            raise ValueError("window must be a positive integer")
+        min_periods = window if min_periods is None else min_periods
+        if not 0 <= min_periods <= window:
+            raise ValueError(f"min_periods {min_periods} must be between 0 and window {window}")
+        return Rolling(self, int(window), min_periods)
+
+    def expanding(self, min_periods: int = 1) -> Expanding:
+        if min_periods < 0:
+            raise ValueError("min_periods must be >= 0")
+        return Expanding(self, min_periods)
+
+    def lazy(self) -> LazyFrame:
+        return LazyFrame(self)
+
+    def groupby(self, key: str) -> GroupBy:
+        cache_key = ('groupby', key, self.start, self.stop)
+        grouping = self._cache.get(cache_key)
+        if grouping is None:
+            grouping = Grouping(self._column(key))
+            self._cache[cache_key] = grouping
+        return GroupBy(self, key, grouping)
+
+    def asof(self, label) -> Optional['FastRow']:
+        position = int(np.searchsorted(self._require_index(), self._labels(label), 'right')) - 1
+        if position < 0:
+            return None
+        return self.loc._get_row(position)
+
+    def merge_asof(self, other: 'FastDataFrameView', tolerance=None, suffix: str = '_right') -> 'FastDataFrame':
+        left = self._require_index()
+        right = other._require_index()
+        positions = np.searchsorted(right, other._labels(left), 'right') - 1
+        valid = positions >= 0
+        if tolerance is not None:
+            valid[valid] = left[valid] - right[positions[valid]] <= tolerance
+        positions[~valid] = 0
+        columns = {name: self._column(name).copy() for name in self.column_names}
+        for name in other.column_names:
+            if name == other.index_name and name == self.index_name:
+                continue
+            source = other._column(name)
+            values = source[positions] if len(source) else np.empty(len(positions), dtype=source.dtype)
+            columns[name + suffix if name in columns else name] = _with_missing(values, ~valid)
+        result = FastDataFrame.from_dict(columns)
+        if self.index_name in result.column_indices:
+            result.set_index(self.index_name)
+        return result
+
+    def to_pandas(self, copy: Optional[bool] = None) -> pd.DataFrame:
+        if self.column_locs is None:
+            values = self.blocks[0][self.start:self.stop]
+            df = pd.DataFrame(values.copy() if copy else values, columns=self.column_names, copy=False)
+        else:
+            df = pd.DataFrame({name: self._column(name).copy() if copy else self._column(name) for name in self.column_names},
+                              columns=self.column_names, copy=False)
+        if not copy:
+            shared = []
+            for name in self.column_names:
+                column = self._column(name)
+                if np.may_share_memory(df[name].to_numpy(), column):
+                    shared.append(column)
+                elif copy is False:
+                    raise ValueError(f"Column '{name}' cannot be exported to pandas without a copy")
+            self._share(shared)
+        return df
+
+    def to_arrow(self, copy: Optional[bool] = None):
+        columns = [self._column(name) for name in self.column_names]
+        table = interop.to_arrow(columns, self.column_names, copy)
+        if not copy:
+            self._share([column for column in columns if interop.arrow_zero_copy(column)])
+        return table
 
-    def any(self, axis: int = 0) -> np.ndarray:
-        return np.any(self.data[self.start:self.stop], axis=axis)
+    def __array__(self, dtype=None, copy: Optional[bool] = None) -> np.ndarray:
+        if self.column_locs is None:
+            values = self.blocks[0][self.start:self.stop]
+        elif copy is False:
+            raise ValueError("Columns in several blocks cannot be exported as one array without a copy")
+        else:
+            values = self._consolidate(self.start, self.stop)
+            copy = None
+        if copy:
+            return np.array(values, dtype=dtype)
+        if copy is False and dtype is not None and np.dtype(dtype) != values.dtype:
+            raise ValueError(f"Cannot convert {values.dtype} to {np.dtype(dtype)} without a copy")
+        # np.asarray rather than np.array(copy=None), which NumPy 1.x rejects.
+        result = np.asarray(values, dtype=dtype)
+        if np.may_share_memory(result, values):
+            self._share([result])
+        return result
+
+    def __dlpack__(self, **kwargs):
+        copy = kwargs.pop('copy', None)
+        return self.__array__(copy=copy).__dlpack__(**kwargs)
+
+    def __dlpack_device__(self) -> Tuple[int, int]:
+        return self.blocks[0].__dlpack_device__()
+
+    def save(self, path: str) -> None:
+        blocks = [block[self.start:self.stop] for block in self.blocks]
+        block_names = [[self.column_names[i] for i in positions] for positions in self._block_positions()]
+        storage.write_frame(path, blocks, block_names, self.column_names, self.index_name)
 
     @property
     def loc(self) -> LocIndexer:
@@ -155,31 +599,402 @@ class FastDataFrameView:
         return self._loc
 
 class FastDataFrame(FastDataFrameView):
-    def __init__(self, data: np.ndarray, column_names: List[str]):
-        super().__init__(np.ascontiguousarray(data), list(column_names),
-                         {name: index for index, name in enumerate(column_names)}, 0, len(data))
+    def __init__(self, data: np.ndarray, column_names: List[str], capacity: Optional[int] = None):
+        self._init_blocks([np.ascontiguousarray(data)], list(column_names), None, capacity)
+
+    def _init_blocks(self, blocks: List[np.ndarray], column_names: List[str],
+                     column_locs: Optional[Dict[str, Tuple[int, int]]], capacity: Optional[int] = None,
+                     owned: Optional[List[bool]] = None) -> None:
+        # owned flags blocks whose memory this frame may write to in place; the others (shared with
+        # pandas, Arrow or an export) are copied on the first write. See __setitem__.
+        rows = len(blocks[0])
+        capacity = rows if capacity is None else max(capacity, rows)
+        owned = [True] * len(blocks) if owned is None else owned
+        self._buffers = []
+        self._owned = []
+        for block, block_owned in zip(blocks, owned):
+            if capacity > rows:
+                buffer = np.empty((capacity, block.shape[1]), dtype=block.dtype)
+                buffer[:rows] = block
+                block_owned = True
+            else:
+                buffer = block
+            self._buffers.append(buffer)
+            self._owned.append(block_owned and buffer.flags.writeable)
+        super().__init__(None, column_names, {name: index for index, name in enumerate(column_names)}, 0, rows,
+                         [buffer[:rows, :block.shape[1]] for buffer, block in zip(self._buffers, blocks)], column_locs)
+        self._index_buffer = None
+        self._mmap = None
+        # Set once a writable mapped frame has been copied to memory; flush() can no longer save it.
+        self._detached = False
+
+    @staticmethod
+    def _from_blocks(blocks: List[np.ndarray], block_names: List[List[str]], column_names: List[str],
+                     owned: Optional[List[bool]] = None) -> 'FastDataFrame':
+        frame = FastDataFrame.__new__(FastDataFrame)
+        if len(blocks) == 1 and list(block_names[0]) == list(column_names):
+            column_locs = None
+        else:
+            column_locs = {name: (block, col) for block, names in enumerate(block_names) for col, name in enumerate(names)}
+        frame._init_blocks([np.ascontiguousarray(block) for block in blocks], list(column_names), column_locs, owned=owned)
+        return frame
+
+    @staticmethod
+    def from_dict(columns: Dict[str, Union[np.ndarray, List]], copy: Optional[bool] = True) -> 'FastDataFrame':
+        # copy=None shares columns that already form a row-major block and copies the rest into one;
+        # copy=False never copies, giving columns that do not share memory a block of their own.
+        if not columns:
+            return FastDataFrame(np.empty((0, 0)), [])
+        arrays = {name: np.asarray(values) for name, values in columns.items()}
+        lengths = {len(array) for array in arrays.values()}
+        if len(lengths) != 1 or any(array.ndim != 1 for array in arrays.values()):
+            raise ValueError("All columns must be one-dimensional and of equal length")
+        groups = {}
+        for name, array in arrays.items():
+            groups.setdefault(array.dtype, []).append(name)
+        blocks = []
+        block_names = []
+        owned = []
+        for names in groups.values():
+            group = [arrays[name] for name in names]
+            stacked = None if copy else interop.stacked_block(group)
+            if stacked is not None:
+                block, order = stacked
+                blocks.append(block)
+                block_names.append([names[i] for i in order])
+                owned.append(False)
+            elif copy is False:
+                for name, array in zip(names, group):
+                    if not array.flags.c_contiguous:
+                        raise ValueError(f"Column '{name}' is not contiguous and cannot be used without a copy")
+                    blocks.append(array[:, None])
+                    block_names.append([name])
+                    owned.append(False)
+            else:
+                blocks.append(np.column_stack(group))
+                block_names.append(names)
+                owned.append(True)
+        return FastDataFrame._from_blocks(blocks, block_names, list(arrays), owned)
+
+    @staticmethod
+    def from_pandas(df: 'pd.DataFrame', copy: Optional[bool] = None) -> 'FastDataFrame':
+        columns = {}
+        for name in df.columns:
+            series = df[name]
+            if copy is False and not isinstance(series.dtype, np.dtype):
+                raise ValueError(f"Column '{name}' of dtype {series.dtype} cannot be used without a copy")
+            columns[name] = series.to_numpy()
+        return FastDataFrame.from_dict(columns, copy=copy)
+
+    @staticmethod
+    def from_arrow(data, copy: Optional[bool] = None) -> 'FastDataFrame':
+        names, columns = interop.arrow_columns(data, copy)
+        return FastDataFrame.from_dict(dict(zip(names, columns)), copy=copy)
 
     @staticmethod
-    def from_pandas(df: 'pd.DataFrame') -> 'FastDataFrame':
-        return FastDataFrame(df.values, df.columns)
-    
+    def read_csv(path: str, chunksize: int = 16384, dtype: Any = np.float64, delimiter: str = ',',
+                 columns: Optional[List[str]] = None, iterator: bool = False):
+        dtype = np.dtype(dtype)
+        chunks = readers.csv_chunks(path, chunksize, dtype, delimiter, columns)
+        if iterator:
+            return (FastDataFrameView(values, names, {name: i for i, name in enumerate(names)}, 0, len(values))
+                    for names, values in chunks)
+        frame = None
+        for names, values in chunks:
+            if frame is None:
+                frame = FastDataFrame(np.empty((0, len(names)), dtype=dtype), names, capacity=readers.estimate_rows(path))
+            frame.append_rows(values)
+        return frame
+
+    @staticmethod
+    def read_binary(path: str, columns: List[str], dtype: Any = np.float64, offset: int = 0,
+                    chunksize: int = 65536, iterator: bool = False):
+        # Headerless row-major records, e.g. written by ndarray.tofile.
+        dtype = np.dtype(dtype)
+        columns = list(columns)
+        column_indices = {name: i for i, name in enumerate(columns)}
+        if iterator:
+            return (FastDataFrameView(values, columns, column_indices, 0, len(values))
+                    for values in readers.binary_chunks(path, len(columns), dtype, offset, chunksize))
+        rows = readers.binary_rows(path, len(columns), dtype, offset)
+        data = np.fromfile(path, dtype=dtype, count=rows * len(columns), offset=offset)
+        return FastDataFrame(data.reshape(rows, len(columns)), columns)
+
+    @staticmethod
+    def open(path: str, mode: str = 'r') -> 'FastDataFrame':
+        mapping, blocks, block_names, column_names, index_name = storage.open_frame(path, mode)
+        frame = FastDataFrame._from_blocks(blocks, block_names, column_names)
+        # Writes to an r+ frame are meant to reach the file.
+        frame._owned = [True] * len(blocks)
+        frame._mmap = mapping
+        # Saved indexes were validated when set, so skip the O(n) sortedness scan.
+        frame.index_name = index_name
+        frame._refresh_index()
+        return frame
+
+    def cache_stats(self, enabled: bool = True) -> None:
+        # Applies to this frame and the loc slices taken from it afterwards.
+        self._stats = enabled
+        if not enabled:
+            for key in [key for key in self._cache if key[0] == 'stats']:
+                del self._cache[key]
+
+    def set_index(self, key: Optional[str]) -> None:
+        if key is not None:
+            _check_sorted(self._column(key))
+        self.index_name = key
+        self._index = None
+        self._index_buffer = None
+        self._refresh_index()
+        self._loc = None
+
+    def _refresh_index(self, start: int = 0) -> None:
+        # Binary search needs a contiguous array. A column that is alone in its block already is one;
+        # otherwise the labels are mirrored into their own growable buffer.
+        if self.index_name is None:
+            return
+        block, col = self._locate(self.index_name)
+        column = self.blocks[block][:, col]
+        if column.flags.c_contiguous:
+            self._index = column
+            self._index_buffer = None
+            return
+        buffer = self._index_buffer
+        if buffer is None or len(buffer) < self.stop or buffer.dtype != column.dtype:
+            buffer = np.empty(self.capacity, dtype=column.dtype)
+            start = 0
+        buffer[start:self.stop] = column[start:]
+        self._index_buffer = buffer
+        self._index = buffer[:self.stop]
+
+    def _disown(self, arrays: List[np.ndarray]) -> None:
+        for block, buffer in enumerate(self._buffers):
+            if self._owned[block] and any(np.may_share_memory(buffer, array) for array in arrays):
+                self._owned[block] = False
+
+    def flush(self) -> None:
+        if self._detached:
+            raise ValueError("Frame has been reallocated and is no longer backed by its file; use save() instead")
+        if self._mmap is not None:
+            self._mmap.flush()
+
+    @property
+    def capacity(self) -> int:
+        return self._buffers[0].shape[0]
+
+    def _reallocate(self, block: int, capacity: int, width: int, dtype: np.dtype,
+                    columns: Optional[List[int]] = None) -> None:
+        # columns selects the columns of the block to keep; by default all of them are.
+        buffer = np.empty((capacity, width), dtype=dtype)
+        filled = self.blocks[block] if columns is None else self.blocks[block][:, columns]
+        buffer[:filled.shape[0], :filled.shape[1]] = filled
+        self._buffers[block] = buffer
+        self._owned[block] = True
+        # Cached rows point into the old buffer, and a mapped frame is now detached from its file.
+        self._loc = None
+        if self._mmap is not None and self._mmap.mode == 'r+':
+            self._detached = True
+        self._mmap = None
+
+    def _reserve(self, rows: int) -> None:
+        if rows > self.capacity:
+            capacity = max(rows, 2 * self.capacity, _MIN_CAPACITY)
+            for block, buffer in enumerate(self._buffers):
+                self._reallocate(block, capacity, buffer.shape[1], buffer.dtype)
+
+    def _refresh(self, rows: int, widths: List[int]) -> None:
+        # Views hold on to the previous list, so always publish a new one.
+        self.blocks = [buffer[:rows, :width] for buffer, width in zip(self._buffers, widths)]
+        self.stop = rows
+
+    def append_rows(self, batch: Union[np.ndarray, List, Dict[str, Any]]) -> None:
+        positions = self._block_positions()
+        if isinstance(batch, dict):
+            parts = [np.column_stack([np.atleast_1d(batch[self.column_names[i]]) for i in block_positions])
+                     for block_positions in positions]
+        else:
+            batch = np.asarray(batch)
+            if batch.ndim == 1:
+                batch = batch.reshape(1, -1)
+            if batch.ndim != 2 or batch.shape[1] != len(self.column_names):
+                raise ValueError(f"Expected rows with {len(self.column_names)} columns, got shape {batch.shape}")
+            parts = [batch if self.column_locs is None else batch[:, block_positions] for block_positions in positions]
+        if len({len(part) for part in parts}) > 1:
+            raise ValueError("All columns must have the same number of rows")
+        if self.index_name is not None:
+            block, col = self._locate(self.index_name)
+            labels = parts[block][:, col]
+            _check_sorted(labels if self.stop == 0 else np.concatenate([self._index[-1:], labels]))
+        widths = [block.shape[1] for block in self.blocks]
+        start = self.stop
+        rows = self.stop + len(parts[0])
+        self._reserve(rows)
+        for block, part in enumerate(parts):
+            dtype = np.result_type(self._buffers[block].dtype, part.dtype)
+            if dtype != self._buffers[block].dtype:
+                self._reallocate(block, self.capacity, self._buffers[block].shape[1], dtype)
+            self._buffers[block][self.stop:rows, :widths[block]] = part
+        self._refresh(rows, widths)
+        self._refresh_index(start)
+        # Cached entries are keyed by row range; drop them rather than let them pile up while streaming.
+        self._invalidate()
+
+    def add_column(self, key: str, value: Union[np.ndarray, List, Any]) -> None:
+        if key in self.column_indices:
+            raise ValueError(f"Column '{key}' already exists")
+        if isinstance(value, (np.ndarray, list)) and len(value) == len(self):
+            new_column = np.asarray(value)
+        else:
+            new_column = np.full(len(self), value)
+        widths = [block.shape[1] for block in self.blocks]
+        block = next((i for i, buffer in enumerate(self._buffers) if buffer.dtype == new_column.dtype), None)
+        if block is None:
+            block = len(self._buffers)
+            self._buffers.append(np.empty((self.capacity, 1), dtype=new_column.dtype))
+            self._owned.append(True)
+            widths.append(0)
+        elif widths[block] == self._buffers[block].shape[1]:
+            self._reallocate(block, self.capacity, max(widths[block] + 1, 2 * widths[block]), new_column.dtype)
+        self._buffers[block][:self.stop, widths[block]] = new_column
+        # Views share the name and location maps, so publish new ones rather than editing them.
+        if self.column_locs is None and block != 0:
+            self.column_locs = {name: (0, i) for i, name in enumerate(self.column_names)}
+        if self.column_locs is not None:
+            self.column_locs = {**self.column_locs, key: (block, widths[block])}
+        widths[block] += 1
+        self.column_indices = {**self.column_indices, key: len(self.column_names)}
+        self.column_names = self.column_names + [key]
+        self._refresh(self.stop, widths)
+        self._refresh_index()
+        self._loc = None
+
+    def _move_column(self, key: str, value: np.ndarray) -> None:
+        # Gives a column whose new values do not fit its block's dtype a block of the wider dtype.
+        # Views keep the previous layout, so the name and location maps are replaced, not edited.
+        block, col = self._locate(key)
+        widths = [block.shape[1] for block in self.blocks]
+        if widths[block] == 1:
+            self._reallocate(block, self.capacity, self._buffers[block].shape[1], value.dtype)
+            self._refresh(self.stop, widths)
+            self.blocks[block][:, 0] = value
+            self._refresh_index()
+            return
+        keep = [i for i in range(widths[block]) if i != col]
+        self._reallocate(block, self.capacity, widths[block] - 1, self._buffers[block].dtype, keep)
+        widths[block] -= 1
+        column_locs = self.column_locs or {name: (0, i) for i, name in enumerate(self.column_names)}
+        self.column_locs = {name: (b, c - (b == block and c > col)) for name, (b, c) in column_locs.items() if name != key}
+        position = self.column_indices[key]
+        self.column_names = [name for name in self.column_names if name != key]
+        self.column_indices = {name: i for i, name in enumerate(self.column_names)}
+        self._refresh(self.stop, widths)
+        self.add_column(key, value)
+        self.column_names = self.column_names[:position] + [key] + self.column_names[position:-1]
+        self.column_indices = {name: i for i, name in enumerate(self.column_names)}
+
     def __setitem__(self, key: str, value: Union[np.ndarray, List, Any]) -> None:
         if isinstance(key, str):
             if key in self.column_indices:
-                col_index = self.column_indices[key]
+                block, col = self._locate(key)
                 if isinstance(value, (np.ndarray, list)) and len(value) == len(self):
-                    self.data[:, col_index] = value
+                    value = np.asarray(value)
                 else:
-                    self.data[:, col_index] = np.full(len(self), value)
+                    value = np.full(len(self), value)
+                if key == self.index_name:
+                    _check_sorted(value)
+                try:
+                    dtype = np.result_type(self.blocks[block].dtype, value.dtype)
+                except TypeError:
+                    dtype = self.blocks[block].dtype
+                if dtype != self.blocks[block].dtype:
+                    if self._mmap is not None and not self.blocks[block].flags.writeable:
+                        raise ValueError("Frame is mapped read-only; open it with mode='r+' to assign")
+                    self._move_column(key, value.astype(dtype))
+                    self._invalidate(key)
+                    return
+                if not self._owned[block]:
+                    # Blocks shared with pandas, Arrow or an export are copied on the first write.
+                    buffer = self._buffers[block]
+                    self._reallocate(block, self.capacity, buffer.shape[1], buffer.dtype)
+                    self._refresh(self.stop, [block.shape[1] for block in self.blocks])
+                self.blocks[block][:, col] = value
+                self._invalidate(key)
+                if key == self.index_name:
+                    self._refresh_index()
             else:
-                new_col_index = self.data.shape[1]
-                if isinstance(value, (np.ndarray, list)) and len(value) == len(self):
-                    new_column = np.array(value).reshape(-1, 1)
-                else:
-                    new_column = np.full((len(self), 1), value)
-                self.data = np.column_stack((self.data, new_column))
-                self.column_indices[key] = new_col_index
-                self.column_names.append(key)
+                self.add_column(key, value)
         else:
             raise ValueError("Only string column names are supported for assignment")
 
+# Profiling wraps these methods only while it is enabled, so it costs nothing otherwise.
+_PROFILED_METHODS = {
+    LocIndexer: ['__getitem__'],
+    FastDataFrameView: ['__getitem__', '__array__', 'shift', 'mean', 'sum', 'min', 'max', 'any', 'isna', 'fillna',
+                        'dropna', 'asof', 'merge_asof', 'to_pandas', 'to_arrow', 'save'],
+    FastDataFrame: ['__setitem__', 'append_rows', 'add_column', 'set_index'],
+}
+_profile = {}
+_profile_lock = threading.Lock()
+# Nesting depth of profiled calls, per thread so concurrent callers are all recorded.
+_profile_state = threading.local()
+
+def _result_arrays(result) -> List[np.ndarray]:
+    if isinstance(result, np.ndarray):
+        return [result]
+    elif isinstance(result, FastDataFrameView):
+        return result.blocks
+    elif isinstance(result, BlockRow):
+        return result.rows
+    elif isinstance(result, FastRow):
+        return [result.data]
+    return []
+
+def _record(name: str, obj, before: List[np.ndarray], result, elapsed: float) -> None:
+    # A result is a view if all of its data lies in the blocks the operation started from. For
+    # in-place operations, the blocks afterwards are checked instead, which catches reallocations.
+    arrays = _result_arrays(result)
+    if result is None and isinstance(obj, FastDataFrame):
+        arrays = obj.blocks
+    copied = [array for array in arrays if not any(np.may_share_memory(array, source) for source in before)]
+    with _profile_lock:
+        entry = _profile.setdefault(name, {'calls': 0, 'seconds': 0.0, 'bytes': 0, 'views': 0, 'copies': 0})
+        entry['calls'] += 1
+        entry['seconds'] += elapsed
+        entry['bytes'] += sum(array.nbytes for array in copied)
+        if arrays:
+            entry['copies' if copied else 'views'] += 1
+
+def _profiled(name: str, method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if getattr(_profile_state, 'depth', 0):
+            # Only the outermost operation is recorded, e.g. dropna but not the isna inside it.
+            return method(self, *args, **kwargs)
+        before = list(self.obj.blocks if isinstance(self, LocIndexer) else self.blocks)
+        _profile_state.depth = 1
+        start = time.perf_counter()
+        try:
+            result = method(self, *args, **kwargs)
+        finally:
+            _profile_state.depth = 0
+        _record(name, self, before, result, time.perf_counter() - start)
+        return result
+    wrapper.__wrapped_method__ = method
+    return wrapper
+
+def _set_profiling(enabled: bool) -> None:
+    for cls, names in _PROFILED_METHODS.items():
+        for attr in names:
+            method = cls.__dict__[attr]
+            original = getattr(method, '__wrapped_method__', method)
+            setattr(cls, attr, _profiled(f"{cls.__name__}.{attr}", original) if enabled else original)
+
+def get_profile() -> Dict[str, Dict[str, Any]]:
+    # Per operation: calls, seconds, bytes of newly allocated result data, and how many calls
+    # returned views versus copies.
+    with _profile_lock:
+        return {name: dict(entry) for name, entry in _profile.items()}
+
+def reset_profile() -> None:
+    with _profile_lock:
+        _profile.clear()
@@ -0,0 +1,139 @@
+import numpy as np
+import pandas as pd
+from typing import List, Dict, Union
+from . import utils
+
+AGGREGATIONS = ('sum', 'mean', 'min', 'max', 'count')
+
+
+class Grouping:
+    # Hash-based factorization of one key column into dense, sorted group codes. Built once and
+    # reused by every aggregation; the group-sorted row order is only derived when min/max need it.
+    def __init__(self, keys: np.ndarray):
+        codes, uniques = pd.factorize(keys, sort=True)
+        self.codes = codes
+        self.uniques = np.asarray(uniques, dtype=keys.dtype)
+        self._valid = None if len(codes) == 0 or codes.min() >= 0 else np.flatnonzero(codes >= 0)
+        self.counts = np.bincount(self._valid_codes, minlength=len(self.uniques))
+        self.starts = np.concatenate([[0], np.cumsum(self.counts)[:-1]]).astype(np.intp)
+        self._order = None
+
+    @property
+    def ngroups(self) -> int:
+        return len(self.uniques)
+
+    @property
+    def _valid_codes(self) -> np.ndarray:
+        return self.codes if self._valid is None else self.codes[self._valid]
+
+    @property
+    def order(self) -> np.ndarray:
+        # Row positions sorted by group, without the rows whose key is missing.
+        if self._order is None:
+            # Narrow codes let the stable sort use radix sort; missing keys (-1) wrap to the
+            # largest value, past every real group, and are cut off the end.
+            codes = self.codes.astype(np.min_scalar_type(self.ngroups))
+            self._order = np.argsort(codes, kind='stable')[:self.counts.sum()]
+        return self._order
+
+    def _rows(self, data: np.ndarray) -> np.ndarray:
+        return data if self._valid is None else data[self._valid]
+
+    def _bincount(self, weights: np.ndarray) -> np.ndarray:
+        return np.bincount(self._valid_codes, weights=self._rows(weights), minlength=self.ngroups)
+
+    def reduce(self, how: str, data: np.ndarray) -> np.ndarray:
+        # data is one 2D block slice. min/max, and sums of exact integer types, run as a single
+        # reduceat over the group-sorted rows of every column; the rest are one bincount per column.
+        if how not in AGGREGATIONS:
+            raise ValueError(f"Unknown aggregation '{how}', expected one of {AGGREGATIONS}")
+        if self.ngroups == 0:
+            dtype = {'mean': data.dtype if data.dtype.kind == 'f' else np.float64, 'count': np.int64}.get(how, data.dtype)
+            return np.empty((0, data.shape[1]), dtype=dtype)
+        if how in ('min', 'max'):
+            ufunc = np.fmin if how == 'min' else np.fmax
+            return ufunc.reduceat(np.take(data, self.order, axis=0), self.starts, axis=0)
+        if how == 'sum' and data.dtype.kind in 'iu':
+            return np.add.reduceat(np.take(data, self.order, axis=0), self.starts, axis=0)
+        missing = utils.isna(data) if utils.can_be_missing(data.dtype) else None
+        if how == 'count' or how == 'mean':
+            counts = np.column_stack([
+                self.counts if missing is None or not missing[:, i].any() else self._bincount(~missing[:, i]).astype(np.int64)
+                for i in range(data.shape[1])
+            ])
+            if how == 'count':
+                return counts
+        values = data if missing is None else np.where(missing, 0, data)
+        sums = np.column_stack([self._bincount(values[:, i]) for i in range(data.shape[1])])
+        # bincount accumulates in float64; results take the dtype np.nansum and np.nanmean would.
+        if how == 'sum':
+            if data.dtype.kind == 'b':
+                return sums.astype(np.int64)
+            return sums.astype(data.dtype) if data.dtype.kind == 'f' else sums
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / counts
+        return means.astype(data.dtype) if data.dtype.kind == 'f' else means
+
+
+class GroupBy:
+    def __init__(self, obj, key: str, grouping: Grouping):
+        self.obj = obj
+        self.key = key
+        self.grouping = grouping
+
+    @property
+    def ngroups(self) -> int:
+        return self.grouping.ngroups
+
+    @property
+    def codes(self) -> np.ndarray:
+        return self.grouping.codes
+
+    def agg(self, spec: Dict[str, Union[str, List[str]]]):
+        from .core import FastDataFrame
+        requests = []
+        for column, hows in spec.items():
+            hows = [hows] if isinstance(hows, str) else list(hows)
+            for how in hows:
+                if how not in AGGREGATIONS:
+                    raise ValueError(f"Unknown aggregation '{how}', expected one of {AGGREGATIONS}")
+                name = column if len(hows) == 1 and column != self.key else f"{column}_{how}"
+                requests.append((column, how, name))
+        # Every aggregation runs once per block, over all the columns of that block that request it.
+        by_block = {}
+        for column, how, name in requests:
+            block, col = self.obj._locate(column)
+            by_block.setdefault((block, how), []).append((col, name))
+        results = {}
+        for (block, how), items in by_block.items():
+            cols = sorted({col for col, _ in items})
+            positions = {col: i for i, col in enumerate(cols)}
+            if cols[-1] - cols[0] + 1 == len(cols):
+                cols = slice(cols[0], cols[-1] + 1)
+            reduced = self.grouping.reduce(how, self.obj.blocks[block][self.obj.start:self.obj.stop, cols])
+            for col, name in items:
+                results[name] = reduced[:, positions[col]]
+        columns = {self.key: self.grouping.uniques}
+        for _, _, name in requests:
+            columns[name] = results[name]
+        result = FastDataFrame.from_dict(columns)
+        result.set_index(self.key)
+        return result
+
+    def _agg_all(self, how: str):
+        return self.agg({name: how for name in self.obj.column_names if name != self.key})
+
+    def sum(self):
+        return self._agg_all('sum')
+
+    def mean(self):
+        return self._agg_all('mean')
+
+    def min(self):
+        return self._agg_all('min')
+
+    def max(self):
+        return self._agg_all('max')
+
+    def count(self):
+        return self._agg_all('count')
@@ -0,0 +1,76 @@
+import numpy as np
+from typing import List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+# Arrow keeps booleans as bits, so only these kinds map onto Arrow buffers as they are.
+_ARROW_ZERO_COPY_KINDS = 'iufmM'
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("Arrow interop requires pyarrow; install it with 'pip install pyarrow'")
+    return pa
+
+
+def _address(array: np.ndarray) -> int:
+    return array.__array_interface__['data'][0]
+
+
+def stacked_block(arrays: List[np.ndarray]) -> Optional[Tuple[np.ndarray, List[int]]]:
+    # Same-dtype columns that are the columns of one C-contiguous 2D array, as pandas keeps them, can
+    # be used in place as a block. Returns the block and the order of the arrays within it.
+    rows = len(arrays[0])
+    itemsize = arrays[0].dtype.itemsize
+    order = sorted(range(len(arrays)), key=lambda i: _address(arrays[i]))
+    first = arrays[order[0]]
+    row_stride = len(arrays) * itemsize
+    for position, i in enumerate(order):
+        array = arrays[i]
+        if _address(array) != _address(first) + position * itemsize:
+            return None
+        if rows > 1 and array.strides[0] != row_stride:
+            return None
+    block = np.lib.stride_tricks.as_strided(first, shape=(rows, len(arrays)), strides=(row_stride, itemsize),
+                                            writeable=first.flags.writeable)
+    return block, order
+
+
+def arrow_columns(data, copy: Optional[bool]) -> Tuple[List[str], List[np.ndarray]]:
+    _require_pyarrow()
+    columns = []
+    for name, column in zip(data.schema.names, data.columns):
+        if isinstance(column, pa.ChunkedArray) and column.num_chunks == 1:
+            column = column.chunk(0)
+        values = None
+        if isinstance(column, pa.Array):
+            try:
+                # Works for primitive columns without nulls; the result is a read-only view.
+                values = column.to_numpy(zero_copy_only=True)
+            except pa.ArrowInvalid:
+                pass
+        if values is None:
+            if copy is False:
+                raise ValueError(f"Column '{name}' of type {column.type} cannot be used without a copy")
+            values = column.to_numpy(zero_copy_only=False) if isinstance(column, pa.Array) else column.to_numpy()
+        columns.append(values)
+    return list(data.schema.names), columns
+
+
+def arrow_zero_copy(column: np.ndarray) -> bool:
+    return column.flags.c_contiguous and column.dtype.kind in _ARROW_ZERO_COPY_KINDS
+
+
+def to_arrow(columns: List[np.ndarray], names: List[str], copy: Optional[bool]):
+    _require_pyarrow()
+    arrays = []
+    for name, column in zip(names, columns):
+        shared = arrow_zero_copy(column)
+        if not shared and copy is False:
+            raise ValueError(f"Column '{name}' cannot be exported to Arrow without a copy; "
+                             "only columns alone in their block are contiguous")
+        arrays.append(pa.array(column.copy() if copy else column))
+    return pa.Table.from_arrays(arrays, names=[str(name) for name in names])
@@ -0,0 +1,247 @@
+import numpy as np
+from typing import List, Optional, Tuple
+from . import parallel, utils
+
+# Plans run as a pipeline of generators over row chunks. A chunk is the rows of every block over one
+# row range plus the matching index labels (None without an index); no stage ever sees more than a
+# chunk plus the few rows a shift carries over, so nothing full-size is built until collect().
+
+
+def _read(view, start: int, stop: int, rows_per_chunk: int):
+    for i in range(start, stop, rows_per_chunk):
+        j = min(i + rows_per_chunk, stop)
+        yield [block[i:j] for block in view.blocks], None if view._index is None else view._index[i:j]
+
+
+def _filled_dtype(dtype: np.dtype, value) -> np.dtype:
+    if not utils.can_be_missing(dtype):
+        return dtype
+    try:
+        return np.result_type(dtype, value)
+    except TypeError:
+        # As in the eager fillna, only a block that actually has missing values fails.
+        return dtype
+
+
+def _lag(chunks, periods: int, dtypes: List[np.dtype], fills: list, widths: List[int]):
+    # Every chunk comes out the same length; its last rows carry over into the next one.
+    carry = [np.full((periods, width), fill, dtype=dtype) for width, fill, dtype in zip(widths, fills, dtypes)]
+    for blocks, index in chunks:
+        rows = len(blocks[0])
+        combined = [np.concatenate([head, block]) for head, block in zip(carry, blocks)]
+        carry = [block[rows:] for block in combined]
+        yield [block[:rows] for block in combined], index
+
+
+def _lead(chunks, periods: int, dtypes: List[np.dtype], fills: list, widths: List[int]):
+    # Values move up, so the first rows are dropped and the labels lag behind them instead.
+    skip = periods
+    pending = None
+    for blocks, index in chunks:
+        cut = min(skip, len(blocks[0]))
+        skip -= cut
+        if index is not None:
+            index = index if pending is None else np.concatenate([pending, index])
+            index, pending = index[:len(index) - (periods - skip)], index[len(index) - (periods - skip):]
+        yield [block[cut:].astype(dtype, copy=False) for block, dtype in zip(blocks, dtypes)], index
+    rows = periods - skip
+    if rows:
+        yield [np.full((rows, width), fill, dtype=dtype) for width, fill, dtype in zip(widths, fills, dtypes)], pending
+
+
+def _fill(chunks, value, dtypes: List[np.dtype]):
+    for blocks, index in chunks:
+        filled = []
+        for block, dtype in zip(blocks, dtypes):
+            if utils.can_be_missing(block.dtype):
+                mask = utils.isna(block)
+                if mask.any():
+                    block = np.where(mask, value, block)
+            filled.append(block.astype(dtype, copy=False))
+        yield filled, index
+
+
+def _drop(chunks):
+    for blocks, index in chunks:
+        missing = None
+        for block in blocks:
+            if utils.can_be_missing(block.dtype):
+                block_missing = utils.isna(block).any(axis=1)
+                missing = block_missing if missing is None else missing | block_missing
+        if missing is None or not missing.any():
+            yield blocks, index
+        else:
+            keep = ~missing
+            yield [block[keep] for block in blocks], None if index is None else index[keep]
+
+
+def _cut(chunks, begin: int, end: int):
+    position = 0
+    for blocks, index in chunks:
+        rows = len(blocks[0])
+        lo, hi = max(begin - position, 0), min(end - position, rows)
+        position += rows
+        if lo < hi:
+            yield [block[lo:hi] for block in blocks], None if index is None else index[lo:hi]
+        if position >= end:
+            return
+
+
+class LazyFrame:
+    def __init__(self, source, ops: Optional[list] = None, window: Optional[Tuple[int, int]] = None):
+        self.source = source
+        self.ops = [] if ops is None else ops
+        # Source rows the plan covers; loc slices narrow it before anything is read.
+        self.window = (source.start, source.stop) if window is None else window
+
+    def _then(self, op: tuple, window: Optional[Tuple[int, int]] = None) -> 'LazyFrame':
+        return LazyFrame(self.source, self.ops + [op], self.window if window is None else window)
+
+    @property
+    def _aligned(self) -> bool:
+        # Until a dropna, output row i is still source row window[0] + i.
+        return all(op[0] != 'dropna' for op in self.ops)
+
+    def __len__(self) -> int:
+        if not self._aligned:
+            raise TypeError("The length of a lazy frame is unknown after dropna")
+        return self.window[1] - self.window[0]
+
+    def __repr__(self) -> str:
+        steps = [f"loc[{op[2][0]}:{op[2][1]}]" if op[0] == 'slice' else
+                 f"{op[0]}({', '.join(str(arg) for arg in op[1:3] if arg is not None)})" for op in self.ops]
+        return f"LazyFrame(rows {self.window[0]}:{self.window[1]}{''.join(' -> ' + step for step in steps)})"
+
+    @property
+    def loc(self) -> '_LazyLoc':
+        return _LazyLoc(self)
+
+    def _slice(self, key: slice) -> 'LazyFrame':
+        if not isinstance(key, slice):
+            raise TypeError("Lazy frames only support loc with row slices")
+        if not self._aligned:
+            raise ValueError("loc slices must come before dropna in a lazy plan")
+        view = self.source._view(*self.window).loc[key]
+        return self._then(('slice', self.window, (view.start, view.stop)), (view.start, view.stop))
+
+    def shift(self, periods: int = 1, fill_value=None) -> 'LazyFrame':
+        return self._then(('shift', int(periods), fill_value, self.window))
+
+    def fillna(self, value) -> 'LazyFrame':
+        return self._then(('fillna', value))
+
+    def dropna(self, axis: int = 0) -> 'LazyFrame':
+        if axis != 0:
+            raise ValueError("Lazy dropna only supports axis=0")
+        return self._then(('dropna',))
+
+    def mean(self) -> 'LazyReduction':
+        return LazyReduction(self, np.nanmean)
+
+    def sum(self) -> 'LazyReduction':
+        return LazyReduction(self, np.nansum)
+
+    def min(self) -> 'LazyReduction':
+        return LazyReduction(self, np.nanmin)
+
+    def max(self) -> 'LazyReduction':
+        return LazyReduction(self, np.nanmax)
+
+    def any(self) -> 'LazyReduction':
+        return LazyReduction(self, np.any)
+
+    def _source_range(self) -> Tuple[int, int]:
+        # Walk the row-aligned part of the plan backwards: each shift widens the rows it needs by its
+        # halo, but never past the window it was recorded on, since it fills beyond that.
+        lo, hi = self.window
+        aligned = []
+        for op in self.ops:
+            if op[0] == 'dropna':
+                break
+            aligned.append(op)
+        for op in reversed(aligned):
+            if op[0] == 'shift':
+                periods, window = op[1], op[3]
+                lo, hi = max(lo - max(periods, 0), window[0]), min(hi + max(-periods, 0), window[1])
+        return lo, hi
+
+    def _stream(self):
+        from .core import options
+        lo, hi = self._source_range()
+        dtypes = [block.dtype for block in self.source.blocks]
+        widths = [block.shape[1] for block in self.source.blocks]
+        row_bytes = sum(dtype.itemsize * width for dtype, width in zip(dtypes, widths))
+        chunks = _read(self.source, lo, hi, max(1, options['chunk_bytes'] // max(1, row_bytes)))
+        for op in self.ops:
+            if op[0] == 'shift' and op[1] != 0:
+                fills = [utils.fill_value(dtype, op[2]) for dtype in dtypes]
+                dtypes = [utils.shifted_dtype(dtype, fill) for dtype, fill in zip(dtypes, fills)]
+                chunks = (_lag if op[1] > 0 else _lead)(chunks, abs(op[1]), dtypes, fills, widths)
+            elif op[0] == 'fillna':
+                dtypes = [_filled_dtype(dtype, op[1]) for dtype in dtypes]
+                chunks = _fill(chunks, op[1], dtypes)
+            elif op[0] == 'dropna':
+                chunks = _drop(chunks)
+            elif op[0] == 'slice':
+                # The stream here starts at source row max(lo, start of the window before the slice).
+                offset = max(lo, op[1][0])
+                chunks = _cut(chunks, op[2][0] - offset, op[2][1] - offset)
+        return chunks, dtypes, widths
+
+    def collect(self):
+        from .core import FastDataFrameView
+        chunks, dtypes, widths = self._stream()
+        rows = self.window[1] - self.window[0]
+        blocks = [np.empty((rows, width), dtype=dtype) for width, dtype in zip(widths, dtypes)]
+        index = None if self.source._index is None else np.empty(rows, dtype=self.source._index.dtype)
+        count = 0
+        for chunk, labels in chunks:
+            n = len(chunk[0])
+            for block, part in zip(blocks, chunk):
+                block[count:count + n] = part
+            if index is not None:
+                index[count:count + n] = labels
+            count += n
+        if count < rows:
+            # Only dropna makes the result shorter; the buffers are ours alone, so shrink them in place.
+            for block in blocks:
+                block.resize((count, block.shape[1]), refcheck=False)
+            if index is not None:
+                index.resize(count, refcheck=False)
+        source = self.source
+        return FastDataFrameView(None, source.column_names, source.column_indices, 0, count, blocks,
+                                 source.column_locs, index, source.index_name)
+
+
+class _LazyLoc:
+    def __init__(self, frame: LazyFrame):
+        self.frame = frame
+
+    def __getitem__(self, key: slice) -> LazyFrame:
+        return self.frame._slice(key)
+
+
+class LazyReduction:
+    def __init__(self, frame: LazyFrame, func):
+        self.frame = frame
+        self.func = func
+
+    def __repr__(self) -> str:
+        return f"{self.frame!r} -> {self.func.__name__}()"
+
+    def collect(self) -> np.ndarray:
+        chunks, dtypes, widths = self.frame._stream()
+        for dtype in dtypes:
+            if not parallel.supports(self.func, dtype):
+                raise TypeError(f"Cannot reduce columns of dtype {dtype} lazily")
+        partial, combine = parallel._COLUMN_REDUCTIONS[self.func]
+        parts = [[] for _ in dtypes]
+        for chunk, _ in chunks:
+            if not len(chunk[0]):
+                continue
+            for block_parts, block in zip(parts, chunk):
+                block_parts.append(partial(block))
+        for block_parts, width, dtype in zip(parts, widths, dtypes):
+            if not block_parts:
+                block_parts.append(partial(np.empty((0, width), dtype=dtype)))
+        return self.frame.source._scatter([combine(block_parts) for block_parts in parts])
@@ -0,0 +1,67 @@
+import threading
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+# One pool per worker count. Pools are never shut down, since another thread may still be using one.
+_executors = {}
+_executor_lock = threading.Lock()
+
+
+def get_executor(workers: int) -> ThreadPoolExecutor:
+    with _executor_lock:
+        executor = _executors.get(workers)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='fastdf')
+            _executors[workers] = executor
+        return executor
+
+
+def chunk_bounds(rows: int, row_bytes: int, workers: int, chunk_bytes: int) -> List[Tuple[int, int]]:
+    # Enough chunks to keep every worker busy, each small enough to stay in cache.
+    rows_per_chunk = max(1, chunk_bytes // max(1, row_bytes))
+    chunks = max(workers, -(-rows // rows_per_chunk))
+    rows_per_chunk = -(-rows // chunks)
+    return [(i, min(i + rows_per_chunk, rows)) for i in range(0, rows, rows_per_chunk)]
+
+
+def _count(chunk: np.ndarray) -> np.ndarray:
+    if chunk.dtype.kind in 'fc':
+        return chunk.shape[0] - np.isnan(chunk).sum(axis=0)
+    return np.full(chunk.shape[1], chunk.shape[0])
+
+
+def _combine_mean(parts: List[Tuple[np.ndarray, np.ndarray]]) -> np.ndarray:
+    sums = np.sum([part[0] for part in parts], axis=0)
+    counts = np.sum([part[1] for part in parts], axis=0)
+    # Like np.nanmean: float input keeps its precision, everything else becomes float64.
+    dtype = sums.dtype if sums.dtype.kind in 'fc' else np.float64
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return (sums / counts).astype(dtype, copy=False)
+
+
+# Each entry maps a reduction to (partial reduction of one chunk, combination of the partials).
+# min/max go through fmin/fmax, which skip NaN like nanmin/nanmax but do not warn on all-NaN chunks.
+_COLUMN_REDUCTIONS = {
+    np.nansum: (lambda chunk: np.nansum(chunk, axis=0), lambda parts: np.sum(parts, axis=0)),
+    np.nanmin: (lambda chunk: np.fmin.reduce(chunk, axis=0), lambda parts: np.fmin.reduce(parts, axis=0)),
+    np.nanmax: (lambda chunk: np.fmax.reduce(chunk, axis=0), lambda parts: np.fmax.reduce(parts, axis=0)),
+    np.any: (lambda chunk: np.any(chunk, axis=0), lambda parts: np.any(parts, axis=0)),
+    np.nanmean: (lambda chunk: (np.nansum(chunk, axis=0), _count(chunk)), _combine_mean),
+}
+
+
+def supports(func, dtype: np.dtype) -> bool:
+    return func in _COLUMN_REDUCTIONS and dtype.kind in 'biufc'
+
+
+def reduce_columns(func, data: np.ndarray, workers: int, chunk_bytes: int) -> np.ndarray:
+    bounds = chunk_bounds(len(data), data.dtype.itemsize * data.shape[1], workers, chunk_bytes)
+    partial, combine = _COLUMN_REDUCTIONS[func]
+    return combine(list(get_executor(workers).map(lambda bound: partial(data[bound[0]:bound[1]]), bounds)))
+
+
+def reduce_rows(func, data: np.ndarray, workers: int, chunk_bytes: int) -> np.ndarray:
+    bounds = chunk_bounds(len(data), data.dtype.itemsize * data.shape[1], workers, chunk_bytes)
+    parts = get_executor(workers).map(lambda bound: func(data[bound[0]:bound[1]], axis=1), bounds)
+    return np.concatenate(list(parts))
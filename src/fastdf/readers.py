@@ -0,0 +1,44 @@
+import os
+import numpy as np
+import pandas as pd
+from typing import Iterator, List, Optional, Tuple
+
+
+_SAMPLE_BYTES = 1 << 20
+
+
+def csv_chunks(path: str, chunksize: int, dtype: np.dtype, delimiter: str,
+               columns: Optional[List[str]]) -> Iterator[Tuple[List[str], np.ndarray]]:
+    # pandas' C tokenizer parses one chunk at a time, so only that chunk's frame is ever alive.
+    with pd.read_csv(path, sep=delimiter, usecols=columns, dtype=dtype, chunksize=chunksize) as reader:
+        for chunk in reader:
+            yield [str(name) for name in chunk.columns], chunk.to_numpy(dtype=dtype)
+
+
+def estimate_rows(path: str) -> int:
+    # Line length sampled from the start of the file, plus some slack; pages that are never
+    # written cost no memory, while growing past the estimate means a copy.
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        sample = f.read(_SAMPLE_BYTES)
+    lines = sample.count(b'\n')
+    if len(sample) == size:
+        return lines + 1
+    return int(max(lines, 1) * size / len(sample) * 1.1) + 1
+
+
+def binary_rows(path: str, width: int, dtype: np.dtype, offset: int) -> int:
+    row_bytes = width * dtype.itemsize
+    size = os.path.getsize(path) - offset
+    if size < 0 or size % row_bytes:
+        raise ValueError(f"{path} does not hold whole rows of {width} x {dtype} after offset {offset}")
+    return size // row_bytes
+
+
+def binary_chunks(path: str, width: int, dtype: np.dtype, offset: int, chunksize: int) -> Iterator[np.ndarray]:
+    rows = binary_rows(path, width, dtype, offset)
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        for start in range(0, rows, chunksize):
+            count = min(chunksize, rows - start)
+            yield np.fromfile(f, dtype=dtype, count=count * width).reshape(count, width)
@@ -0,0 +1,96 @@
+import numpy as np
+
+ZONE_ROWS = 4096
+# A float range is summed directly when its absolute sum is below this fraction of the absolute
+# sum of everything before it: the difference of two such prefix sums has lost too many bits.
+CANCELLATION = 2.0 ** -20
+
+
+def supports(dtype: np.dtype) -> bool:
+    return dtype.kind in 'biuf'
+
+
+def _prefix(values: np.ndarray, dtype) -> np.ndarray:
+    prefix = np.zeros(len(values) + 1, dtype=dtype)
+    np.cumsum(values, dtype=dtype, out=prefix[1:])
+    return prefix
+
+
+class ColumnStats:
+    # Prefix sums and non-NaN counts answer sum/mean over any row range with two lookups; per-zone
+    # min/max (zone maps) leave only the partial zones at either end of a range to be scanned.
+    def __init__(self, column: np.ndarray):
+        self.rows = len(column)
+        # Floats accumulate in float64; integers keep the exact type np.nansum would use.
+        self.sum_dtype = np.nansum(column[:0]).dtype
+        self.counts = None
+        self.abs_prefix = None
+        self.pos_inf = self.neg_inf = None
+        values = column
+        if column.dtype.kind == 'f':
+            missing = np.isnan(column)
+            if missing.any():
+                self.counts = _prefix(~missing, np.int64)
+            # A single ±inf would turn every later prefix sum into inf or NaN, so infinities are
+            # counted on their own and left out of the sums.
+            finite = np.isfinite(column)
+            if not finite.all():
+                values = np.where(finite, column, 0)
+                if np.isposinf(column).any():
+                    self.pos_inf = _prefix(np.isposinf(column), np.int64)
+                if np.isneginf(column).any():
+                    self.neg_inf = _prefix(np.isneginf(column), np.int64)
+            self.prefix = _prefix(values, np.float64)
+            self.abs_prefix = _prefix(np.abs(values), np.float64)
+        else:
+            self.prefix = _prefix(values, self.sum_dtype)
+        starts = np.arange(0, len(column), ZONE_ROWS)
+        self.zone_min = np.fmin.reduceat(column, starts) if len(column) else column[:0]
+        self.zone_max = np.fmax.reduceat(column, starts) if len(column) else column[:0]
+
+    @staticmethod
+    def _count_between(prefix, start: int, stop: int) -> int:
+        return 0 if prefix is None else int(prefix[stop] - prefix[start])
+
+    def _total(self, column: np.ndarray, start: int, stop: int):
+        if self.abs_prefix is not None:
+            magnitude = self.abs_prefix[stop] - self.abs_prefix[start]
+            if magnitude < self.abs_prefix[stop] * CANCELLATION and self.count(start, stop):
+                # Rare: the range is tiny next to the values before it, e.g. after a huge outlier.
+                return np.nansum(column[start:stop], dtype=np.float64)
+            positive = self._count_between(self.pos_inf, start, stop)
+            negative = self._count_between(self.neg_inf, start, stop)
+            if positive or negative:
+                return np.nan if positive and negative else np.inf if positive else -np.inf
+        return self.prefix[stop] - self.prefix[start]
+
+    def sum(self, column: np.ndarray, start: int, stop: int):
+        return self.sum_dtype.type(self._total(column, start, stop))
+
+    def count(self, start: int, stop: int) -> int:
+        if self.counts is None:
+            return stop - start
+        return int(self.counts[stop] - self.counts[start])
+
+    def mean(self, column: np.ndarray, start: int, stop: int) -> float:
+        count = self.count(start, stop)
+        if count == 0:
+            return np.nan
+        return float(self._total(column, start, stop)) / count
+
+    def _extreme(self, column: np.ndarray, start: int, stop: int, ufunc: np.ufunc, zones: np.ndarray):
+        first, last = -(-start // ZONE_ROWS), stop // ZONE_ROWS
+        if first >= last:
+            return ufunc.reduce(column[start:stop])
+        result = ufunc.reduce(zones[first:last])
+        if start < first * ZONE_ROWS:
+            result = ufunc(result, ufunc.reduce(column[start:first * ZONE_ROWS]))
+        if last * ZONE_ROWS < stop:
+            result = ufunc(result, ufunc.reduce(column[last * ZONE_ROWS:stop]))
+        return result
+
+    def min(self, column: np.ndarray, start: int, stop: int):
+        return self._extreme(column, start, stop, np.fmin, self.zone_min)
+
+    def max(self, column: np.ndarray, start: int, stop: int):
+        return self._extreme(column, start, stop, np.fmax, self.zone_max)
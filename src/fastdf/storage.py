@@ -0,0 +1,71 @@
+import json
+import struct
+import numpy as np
+from typing import List, Dict, Tuple, Any, Optional
+
+MAGIC = b'FASTDF\x00\x01'
+ALIGNMENT = 64
+_WRITE_CHUNK_BYTES = 1 << 24
+
+
+def _padding(offset: int) -> int:
+    return -offset % ALIGNMENT
+
+
+def _header_bytes(header: Dict[str, Any]) -> bytes:
+    payload = json.dumps(header).encode('utf-8')
+    prefix = len(MAGIC) + 8
+    padding = _padding(prefix + len(payload))
+    return MAGIC + struct.pack('<Q', len(payload) + padding) + payload + b' ' * padding
+
+
+def write_frame(path: str, blocks: List[np.ndarray], block_names: List[List[str]], column_names: List[str],
+                index_name: Optional[str] = None) -> None:
+    rows = len(blocks[0]) if blocks else 0
+    header_blocks = []
+    offset = 0
+    for block, names in zip(blocks, block_names):
+        if block.dtype.hasobject:
+            raise TypeError(f"Cannot save columns of dtype {block.dtype} to a memory-mapped file")
+        header_blocks.append({'dtype': block.dtype.str, 'columns': [str(name) for name in names], 'offset': offset})
+        offset += block.nbytes
+        offset += _padding(offset)
+    header = {
+        'columns': [str(name) for name in column_names],
+        'shape': [rows, len(column_names)],
+        'blocks': header_blocks,
+        'index': None if index_name is None else str(index_name),
+    }
+    with open(path, 'wb') as f:
+        f.write(_header_bytes(header))
+        for block in blocks:
+            rows_per_chunk = max(1, _WRITE_CHUNK_BYTES // max(1, block.dtype.itemsize * block.shape[1]))
+            for i in range(0, rows, rows_per_chunk):
+                f.write(np.ascontiguousarray(block[i:i + rows_per_chunk]).tobytes())
+            f.write(b'\x00' * _padding(block.nbytes))
+
+
+def read_header(path: str) -> Tuple[Dict[str, Any], int]:
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a FastDataFrame file")
+        (length,) = struct.unpack('<Q', f.read(8))
+        header = json.loads(f.read(length).decode('utf-8'))
+    return header, len(MAGIC) + 8 + length
+
+
+def open_frame(path: str, mode: str = 'r') -> Tuple[np.memmap, List[np.ndarray], List[List[str]], List[str], Optional[str]]:
+    if mode not in ('r', 'r+'):
+        raise ValueError("Mode must be 'r' or 'r+'")
+    header, data_offset = read_header(path)
+    rows = header['shape'][0]
+    # One mapping for the whole file; each block is a typed view into it, so nothing is read until touched.
+    mapping = np.memmap(path, dtype=np.uint8, mode=mode)
+    blocks = []
+    block_names = []
+    for block in header['blocks']:
+        shape = (rows, len(block['columns']))
+        blocks.append(np.ndarray(shape, dtype=np.dtype(block['dtype']), buffer=mapping,
+                                 offset=data_offset + block['offset'], order='C'))
+        block_names.append(block['columns'])
+    return mapping, blocks, block_names, header['columns'], header.get('index')
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+from typing import List
+
+
+def common_dtype(dtypes: List[np.dtype]) -> np.dtype:
+    try:
+        return np.result_type(*dtypes)
+    except (TypeError, ValueError):
+        return np.dtype(object)
+
+
+def to_object(values: np.ndarray) -> np.ndarray:
+    # Casting datetime64[ns] to object gives plain integers, so go through pandas' Timestamp and Timedelta.
+    if values.dtype.kind not in 'mM':
+        return values
+    return pd.Series(values.ravel()).astype(object).to_numpy().reshape(values.shape)
+
+
+def fill_value(dtype: np.dtype, value=None):
+    # What shift writes into the rows it vacates: the given value, else the dtype's missing marker.
+    if value is not None:
+        return value
+    return dtype.type('NaT', np.datetime_data(dtype)[0]) if dtype.kind in 'mM' else np.nan
+
+
+def shifted_dtype(dtype: np.dtype, fill) -> np.dtype:
+    try:
+        return np.result_type(dtype, fill)
+    except TypeError:
+        # No common dtype (e.g. 0 for a datetime column): the fill is cast into the column instead.
+        return dtype
+
+
+def can_be_missing(dtype: np.dtype) -> bool:
+    return dtype.kind in 'fcmMO'
+
+
+def isna(data: np.ndarray) -> np.ndarray:
+    if data.dtype.kind in 'fc':
+        return np.isnan(data)
+    elif data.dtype.kind in 'mM':
+        return np.isnat(data)
+    elif data.dtype.kind == 'O':
+        return pd.isna(data)
+    return np.zeros(data.shape, dtype=bool)
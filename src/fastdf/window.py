@@ -0,0 +1,163 @@
+import warnings
+import numpy as np
+from typing import Optional, Tuple
+
+_SHIFT_SAMPLE = 1024
+# Rolling sums restart every max(window, _SUM_SPAN) rows, which bounds how far rounding error reaches.
+_SUM_SPAN = 64
+
+
+def _trailing(cumulative: np.ndarray, window: Optional[int]) -> np.ndarray:
+    # Turns cumulative sums along each row into sums over the trailing window.
+    if window is None or window >= cumulative.shape[1]:
+        return cumulative
+    result = np.empty_like(cumulative)
+    result[:, :window] = cumulative[:, :window]
+    np.subtract(cumulative[:, window:], cumulative[:, :-window], out=result[:, window:])
+    return result
+
+
+def _window_sums(values: np.ndarray, window: Optional[int]) -> np.ndarray:
+    # Sums over the trailing window, overwriting values. A running sum over the whole column would
+    # carry the rounding error of one large value into every later window, so the sums restart at
+    # the start of each span and windows that cross into a span add the tail of the previous one.
+    m, n = values.shape
+    if window is None or n <= window:
+        return np.cumsum(values, axis=1, out=values)
+    span = max(window, _SUM_SPAN)
+    padded = np.zeros((m, -(-n // span) * span))
+    padded[:, :n] = values
+    spans = padded.reshape(m, -1, span)
+    np.cumsum(spans, axis=2, out=spans)
+    result = np.empty_like(spans)
+    result[:, :, :window] = spans[:, :, :window]
+    np.subtract(spans[:, :, window:], spans[:, :, :-window], out=result[:, :, window:])
+    result[:, 1:, :window] += spans[:, :-1, -1:] - spans[:, :-1, span - window:]
+    return result.reshape(m, -1)[:, :n]
+
+
+def _window_counts(mask: np.ndarray, window: Optional[int]) -> np.ndarray:
+    # mask is column-major (one row per column), like every array in this module.
+    if not mask.any():
+        counts = np.arange(1, mask.shape[1] + 1)
+        if window is not None:
+            np.minimum(counts, window, out=counts)
+        return np.broadcast_to(counts, mask.shape)
+    return _trailing(np.cumsum(~mask, axis=1, dtype=np.int64), window)
+
+
+def _centered(values: np.ndarray, mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Centering on a sampled column median keeps the cumulative sums small, which avoids
+    # catastrophic cancellation in the sum of squares. Unlike the mean, one outlier cannot move it.
+    step = max(1, values.shape[1] // _SHIFT_SAMPLE)
+    with warnings.catch_warnings():
+        # All-NaN columns have no median; any shift works for them.
+        warnings.simplefilter('ignore', RuntimeWarning)
+        shift = np.nan_to_num(np.nanmedian(values[:, ::step], axis=1))
+    centered = values - shift[:, None]
+    np.copyto(centered, 0.0, where=mask)
+    return shift, centered
+
+
+def _window_extrema(values: np.ndarray, mask: np.ndarray, window: Optional[int],
+                    ufunc: np.ufunc, fill: float) -> np.ndarray:
+    values = np.where(mask, fill, values)
+    if window is None or window >= values.shape[1]:
+        return ufunc.accumulate(values, axis=1)
+    if window == 1:
+        return values
+    # van Herk/Gil-Werman: every window spans at most two blocks of size `window`, so it is
+    # one block suffix combined with one block prefix, each a single vectorized accumulate.
+    m, n = values.shape
+    padded_cols = -(-n // window) * window
+    padded = np.full((m, padded_cols), fill)
+    padded[:, :n] = values
+    blocks = padded.reshape(m, -1, window)
+    prefix = ufunc.accumulate(blocks, axis=2).reshape(m, padded_cols)
+    suffix = ufunc.accumulate(blocks[:, :, ::-1], axis=2)[:, :, ::-1].reshape(m, padded_cols)
+    result = prefix[:, :n]
+    result[:, window - 1:] = ufunc(suffix[:, :n - window + 1], prefix[:, window - 1:n])
+    return result
+
+
+class Rolling:
+    def __init__(self, obj, window: Optional[int], min_periods: int):
+        self.obj = obj
+        self.window = window
+        self.min_periods = min_periods
+        for name, dtype in obj.dtypes.items():
+            if dtype.kind not in 'biuf':
+                raise TypeError(f"Window statistics need numeric columns, but '{name}' has dtype {dtype}; "
+                                "select the numeric columns first")
+        # The engine scans along rows, so it works on a column-major float copy.
+        self._values = np.ascontiguousarray(obj.values.T, dtype=np.float64)
+        self._mask = np.isnan(self._values)
+        # Like pandas, every statistic but count treats ±inf as missing.
+        self._count_mask = self._mask
+        infinite = np.isinf(self._values)
+        if infinite.any():
+            self._values = np.where(infinite, np.nan, self._values)
+            self._mask = self._mask | infinite
+        self._counts = None
+        self._sums = None
+
+    def _get_counts(self) -> np.ndarray:
+        if self._counts is None:
+            self._counts = _window_counts(self._mask, self.window)
+        return self._counts
+
+    def _get_sums(self) -> Tuple[np.ndarray, np.ndarray]:
+        # Window sums of the centered values, plus the centering shift per column.
+        if self._sums is None:
+            shift, centered = _centered(self._values, self._mask)
+            self._sums = shift, _window_sums(centered, self.window)
+        return self._sums
+
+    def _finish(self, result: np.ndarray, required: int = 0):
+        result[self._get_counts() < max(self.min_periods, required)] = np.nan
+        return self.obj._like(np.ascontiguousarray(result.T))
+
+    def count(self):
+        # Like pandas, count only needs min_periods rows in the window, not non-NaN values.
+        counts = self._get_counts() if self._count_mask is self._mask else _window_counts(self._count_mask, self.window)
+        result = counts.T.astype(np.float64)
+        result[:max(self.min_periods - 1, 0)] = np.nan
+        return self.obj._like(result)
+
+    def sum(self):
+        shift, sums = self._get_sums()
+        return self._finish(sums + self._get_counts() * shift[:, None])
+
+    def mean(self):
+        shift, sums = self._get_sums()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            result = sums / self._get_counts()
+        result += shift[:, None]
+        return self._finish(result, 1)
+
+    def var(self, ddof: int = 1):
+        _, sums = self._get_sums()
+        counts = self._get_counts()
+        _, centered = _centered(self._values, self._mask)
+        np.multiply(centered, centered, out=centered)
+        squares = _window_sums(centered, self.window)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            squares -= sums * sums / np.maximum(counts, 1)
+            result = np.maximum(squares, 0.0, out=squares) / (counts - ddof)
+        return self._finish(result, ddof + 1)
+
+    def std(self, ddof: int = 1):
+        result = self.var(ddof)
+        np.sqrt(result.data, out=result.data)
+        return result
+
+    def min(self):
+        return self._finish(_window_extrema(self._values, self._mask, self.window, np.minimum, np.inf), 1)
+
+    def max(self):
+        return self._finish(_window_extrema(self._values, self._mask, self.window, np.maximum, -np.inf), 1)
+
+
+class Expanding(Rolling):
+    def __init__(self, obj, min_periods: int):
+        super().__init__(obj, None, min_periods)
@@ -1,8 +1,17 @@
 import pandas as pd
 import numpy as np
 import time
-from fastdf import fdf 
+from fastdf import fdf, options, set_option
+from fastdf import core
 import unittest
+import warnings
+import os
+import tempfile
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
 
 print("UNITTEST")
 
@@ -108,5 +117,907 @@ class TestFastDataFrame(unittest.TestCase):
         access_speedup = pdf_access_time / fdf_access_time
         print(f"{'Access':10}: fdf {fdf_access_time:.6f}s, pandas {pdf_access_time:.6f}s, Speedup: {access_speedup:.2f}x")
 
+class TestAppend(unittest.TestCase):
+    def setUp(self):
+        self.columns = ['a', 'b', 'c']
+        self.fdf = fdf(np.arange(12, dtype=float).reshape(4, 3), self.columns)
+
+    def test_append_rows(self):
+        self.fdf.append_rows(np.ones((3, 3)))
+        self.fdf.append_rows([7.0, 8.0, 9.0])
+        self.fdf.append_rows({'a': [1.0], 'b': [2.0], 'c': [3.0]})
+        self.assertEqual(len(self.fdf), 9)
+        np.testing.assert_array_equal(self.fdf.loc[-1].data, [1.0, 2.0, 3.0])
+        np.testing.assert_array_equal(self.fdf['a'], [0, 3, 6, 9, 1, 1, 1, 7, 1])
+        with self.assertRaises(ValueError):
+            self.fdf.append_rows(np.ones((1, 2)))
+
+    def test_capacity_doubles(self):
+        capacities = set()
+        for i in range(1000):
+            self.fdf.append_rows([i, i, i])
+            capacities.add(self.fdf.capacity)
+        self.assertEqual(len(self.fdf), 1004)
+        self.assertLessEqual(len(capacities), 8)
+        np.testing.assert_array_equal(self.fdf['b'][4:], np.arange(1000))
+
+    def test_views_survive_growth(self):
+        view = self.fdf.loc[1:2]
+        self.fdf.append_rows(np.zeros((100, 3)))
+        np.testing.assert_array_equal(view['a'], [3.0, 6.0])
+        self.assertTrue(np.shares_memory(self.fdf.loc[0:50].data, self.fdf.data))
+
+    def test_views_survive_add_column(self):
+        view = self.fdf.loc[0:1]
+        self.fdf.add_column('d', np.arange(4.0))
+        self.assertEqual(view.column_names, ['a', 'b', 'c'])
+        np.testing.assert_array_equal(view.values, self.fdf.values[:2, :3])
+        str(view)
+        with self.assertRaises(KeyError):
+            view['d']
+        mixed = fdf.from_dict({'i': np.arange(4), 'x': np.arange(4.0)})
+        view = mixed.loc[0:1]
+        mixed['flag'] = np.ones(4, dtype=bool)
+        np.testing.assert_array_equal(view.mean(), [0.5, 0.5])
+        self.assertEqual(view.loc[0]['x'], 0.0)
+        self.assertEqual(mixed.loc[0:1].column_names, ['i', 'x', 'flag'])
+
+    def test_add_column(self):
+        self.fdf.add_column('d', np.arange(4))
+        self.fdf['e'] = 1.5
+        self.fdf.append_rows(np.ones((2, 5)))
+        self.assertEqual(self.fdf.column_names, ['a', 'b', 'c', 'd', 'e'])
+        np.testing.assert_array_equal(self.fdf['d'], [0, 1, 2, 3, 1, 1])
+        self.assertEqual(self.fdf.loc[0]['e'], 1.5)
+        with self.assertRaises(ValueError):
+            self.fdf.add_column('a', 0)
+
+    def test_append_upcasts(self):
+        frame = fdf(np.zeros((2, 2), dtype=np.int64), ['x', 'y'])
+        frame.append_rows([[0.5, 1.5]])
+        self.assertEqual(frame.data.dtype, np.float64)
+        np.testing.assert_array_equal(frame['x'], [0, 0, 0.5])
+
+class TestStorage(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'frame.fdf')
+        self.data = np.random.rand(1000, 4)
+        self.data[::7, 1] = np.nan
+        self.columns = ['a', 'b', 'c', 'd']
+        self.fdf = fdf(self.data, self.columns)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_roundtrip(self):
+        self.fdf.save(self.path)
+        mapped = fdf.open(self.path)
+        self.assertIsInstance(mapped._mmap, np.memmap)
+        self.assertEqual(mapped.column_names, self.columns)
+        np.testing.assert_array_equal(mapped['b'], self.fdf['b'])
+        np.testing.assert_array_equal(mapped.loc[10:20]['c'], self.fdf.loc[10:20]['c'])
+        np.testing.assert_array_almost_equal(mapped.mean(), self.fdf.mean())
+        np.testing.assert_array_almost_equal(mapped.sum(), self.fdf.sum())
+        np.testing.assert_array_equal(mapped.min(), self.fdf.min())
+        np.testing.assert_array_equal(mapped.max(), self.fdf.max())
+
+    def test_save_view(self):
+        self.fdf.loc[100:199].save(self.path)
+        mapped = fdf.open(self.path)
+        np.testing.assert_array_equal(mapped.data, self.data[100:200])
+
+    def test_read_only(self):
+        self.fdf.save(self.path)
+        mapped = fdf.open(self.path)
+        with self.assertRaises(ValueError):
+            mapped['a'] = 0.0
+
+    def test_read_write(self):
+        self.fdf.save(self.path)
+        mapped = fdf.open(self.path, mode='r+')
+        mapped['a'] = 1.0
+        mapped.flush()
+        del mapped
+        np.testing.assert_array_equal(fdf.open(self.path)['a'], np.ones(1000))
+
+    def test_read_write_detached(self):
+        self.fdf.save(self.path)
+        mapped = fdf.open(self.path, mode='r+')
+        mapped.append_rows(np.zeros((1, 4)))
+        mapped['a'] = 5.0
+        with self.assertRaises(ValueError):
+            mapped.flush()
+        del mapped
+        np.testing.assert_array_equal(fdf.open(self.path)['a'], self.data[:, 0])
+
+    def test_invalid(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'not a frame')
+        with self.assertRaises(ValueError):
+            fdf.open(self.path)
+        self.fdf.save(self.path)
+        with self.assertRaises(ValueError):
+            fdf.open(self.path, mode='w')
+
+class TestWindow(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.data = rng.normal(1000.0, 5.0, size=(500, 3))
+        self.data[rng.random((500, 3)) < 0.2] = np.nan
+        self.data[50:70, 0] = np.nan
+        self.columns = ['a', 'b', 'c']
+        self.pdf = pd.DataFrame(self.data, columns=self.columns)
+        self.fdf = fdf(self.data, self.columns)
+
+    def test_rolling(self):
+        for window, min_periods in [(1, None), (5, None), (7, 3), (10, 0), (600, 1)]:
+            ours = self.fdf.rolling(window, min_periods=min_periods)
+            theirs = self.pdf.rolling(window, min_periods=min_periods)
+            for name in ['count', 'sum', 'mean', 'std', 'var', 'min', 'max']:
+                with self.subTest(window=window, min_periods=min_periods, stat=name):
+                    np.testing.assert_allclose(getattr(ours, name)().data, getattr(theirs, name)().values, rtol=1e-7, atol=1e-8)
+
+    def test_rolling_view(self):
+        view = self.fdf.loc[100:299]
+        np.testing.assert_allclose(view.rolling(20).max()['b'], self.pdf['b'][100:300].rolling(20).max().values)
+
+    def test_expanding(self):
+        for name in ['sum', 'mean', 'std', 'min', 'max']:
+            with self.subTest(stat=name):
+                np.testing.assert_allclose(getattr(self.fdf.expanding(), name)().data, getattr(self.pdf.expanding(), name)().values, rtol=1e-7, atol=1e-8)
+
+    def test_infinite(self):
+        data = np.array([[1.0, np.inf, 2.0, 3.0, -np.inf, 5.0, 6.0, 7.0]]).T
+        ours = fdf(data, ['a'])
+        theirs = pd.DataFrame(data, columns=['a'])
+        for name in ['count', 'sum', 'mean', 'std', 'min', 'max']:
+            with self.subTest(stat=name):
+                np.testing.assert_allclose(getattr(ours.rolling(2), name)()['a'], getattr(theirs.rolling(2), name)()['a'])
+                np.testing.assert_allclose(getattr(ours.expanding(), name)()['a'], getattr(theirs.expanding(), name)()['a'])
+        np.testing.assert_array_equal(ours['a'], data[:, 0])
+
+    def test_large_values(self):
+        # One huge value must not leave rounding error in the windows long after it.
+        clean = self.data[:, 1].copy()
+        clean[np.isnan(clean)] = 1000.0
+        spiked = clean.copy()
+        spiked[0] = 1e15
+        ours = fdf(spiked[:, None], ['b']).rolling(5)
+        theirs = pd.Series(clean).rolling(5)
+        for name in ['sum', 'mean', 'std']:
+            with self.subTest(stat=name):
+                np.testing.assert_allclose(getattr(ours, name)()['b'][200:], getattr(theirs, name)().values[200:], rtol=1e-9)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.fdf.rolling(0)
+        with self.assertRaises(ValueError):
+            self.fdf.rolling(3, min_periods=4)
+        mixed = fdf.from_dict({'x': np.arange(3.0), 't': np.arange(3).astype('datetime64[s]')})
+        with self.assertRaisesRegex(TypeError, "'t'"):
+            mixed.rolling(2).mean()
+        np.testing.assert_array_equal(mixed[['x']].rolling(2).sum()['x'], [np.nan, 1.0, 3.0])
+
+class TestBlocks(unittest.TestCase):
+    def setUp(self):
+        n = 1000
+        rng = np.random.default_rng(1)
+        self.pdf = pd.DataFrame({
+            'f': rng.random(n),
+            'i': rng.integers(0, 100, n),
+            'b': rng.random(n) > 0.5,
+            'g': rng.random(n),
+            't': pd.date_range('2024-01-01', periods=n, freq='min'),
+            'i32': rng.integers(0, 10, n).astype(np.int32),
+        })
+        self.pdf.loc[::10, 'f'] = np.nan
+        self.fdf = fdf.from_pandas(self.pdf)
+
+    def test_native_dtypes(self):
+        self.assertEqual(len(self.fdf.blocks), 5)
+        for name in self.pdf.columns:
+            self.assertEqual(self.fdf[name].dtype, self.pdf[name].dtype)
+            np.testing.assert_array_equal(self.fdf[name], self.pdf[name].to_numpy())
+        self.assertEqual(self.fdf.dtypes['i32'], np.int32)
+        np.testing.assert_array_equal(self.fdf.loc[10:20]['i'], self.pdf['i'][10:21])
+        np.testing.assert_array_equal(self.fdf.loc[10:20].loc['t'], self.pdf['t'][10:21])
+
+    def test_rows(self):
+        row = self.fdf.loc[3]
+        self.assertEqual(row['i'], self.pdf['i'][3])
+        self.assertEqual(row['t'], self.pdf['t'].to_numpy()[3])
+        self.assertEqual(row.data.dtype, object)
+        self.assertEqual(self.fdf.loc[-1]['b'], self.pdf['b'].iloc[-1])
+
+    def test_reductions(self):
+        numeric = self.fdf[['i', 'b', 'g', 'i32']]
+        np.testing.assert_array_almost_equal(numeric.mean().astype(float), self.pdf[['i', 'b', 'g', 'i32']].mean())
+        np.testing.assert_array_almost_equal(numeric.sum().astype(float), self.pdf[['i', 'b', 'g', 'i32']].sum())
+        np.testing.assert_array_almost_equal(numeric.sum(axis=1), self.pdf[['i', 'b', 'g', 'i32']].sum(axis=1))
+        self.assertEqual(self.fdf.min()[4], self.pdf['t'].min())
+        self.assertEqual(self.fdf.max()[1], self.pdf['i'].max())
+        np.testing.assert_array_equal(numeric.any(), self.pdf[['i', 'b', 'g', 'i32']].any())
+
+    def test_missing(self):
+        np.testing.assert_array_equal(self.fdf.isna(), self.pdf.isna())
+        self.assertEqual(len(self.fdf.dropna()), len(self.pdf.dropna()))
+        self.assertEqual(self.fdf.dropna(axis=1).column_names, list(self.pdf.dropna(axis=1).columns))
+        filled = self.fdf.fillna(0)
+        np.testing.assert_array_equal(filled['f'], self.pdf['f'].fillna(0))
+        self.assertEqual(filled['i'].dtype, np.int64)
+
+    def test_masking(self):
+        mask = self.fdf['i'] > 50
+        view = self.fdf[mask]
+        np.testing.assert_array_equal(view['t'], self.pdf['t'][mask].to_numpy())
+        self.assertEqual(view['i32'].dtype, np.int32)
+
+    def test_append_and_assign(self):
+        self.fdf.append_rows({'f': [1.5], 'i': [7], 'b': [True], 'g': [0.0],
+                              't': np.array(['2030-01-01'], dtype='datetime64[ns]'), 'i32': np.array([3], dtype=np.int32)})
+        self.assertEqual(len(self.fdf), 1001)
+        self.assertEqual(self.fdf['i'][-1], 7)
+        self.assertEqual(self.fdf['i'].dtype, np.int64)
+        self.fdf['i'] = 0
+        self.fdf['s'] = np.arange(1001, dtype=np.int16)
+        self.assertEqual(self.fdf['s'].dtype, np.int16)
+        self.assertEqual(self.fdf.loc[5]['s'], 5)
+        self.assertEqual(self.fdf[['i', 's']].sum()[0], 0)
+
+    def test_shift(self):
+        shifted = self.fdf.shift(2)
+        expected = self.pdf.shift(2)
+        self.assertEqual(len(shifted.blocks), len(self.fdf.blocks))
+        for name in self.pdf.columns:
+            with self.subTest(column=name):
+                # pandas makes shifted bools object; like NumPy, we promote them to float64.
+                column = expected[name].astype(float) if name == 'b' else expected[name]
+                self.assertEqual(shifted[name].dtype, column.dtype)
+                np.testing.assert_array_equal(shifted[name], column.to_numpy())
+        pair = fdf.from_dict({'i': np.arange(5), 'b': np.arange(5) % 2 == 0})
+        np.testing.assert_array_equal(pair.shift(-1)['i'], [1, 2, 3, 4, np.nan])
+        np.testing.assert_array_equal(pair.shift(1, fill_value=0)['b'], [0, 1, 0, 1, 0])
+        self.assertEqual(pair.shift(0)['b'].dtype, bool)
+
+    def test_assign_upcasts(self):
+        view = self.fdf.loc[0:9]
+        self.fdf['i'] = np.arange(1000) + 0.5
+        self.assertEqual(self.fdf['i'].dtype, np.float64)
+        np.testing.assert_array_equal(self.fdf['i'], np.arange(1000) + 0.5)
+        np.testing.assert_array_equal(self.fdf['i32'], self.pdf['i32'])
+        self.assertEqual(self.fdf.column_names, list(self.pdf.columns))
+        np.testing.assert_array_equal(view['i'], self.pdf['i'][:10])
+        self.fdf['i32'] = np.nan
+        self.assertTrue(np.isnan(self.fdf['i32']).all())
+        frame = fdf(np.arange(6).reshape(3, 2), ['x', 'y'])
+        frame['x'] = [0.5, 1.5, 2.5]
+        np.testing.assert_array_equal(frame.values, [[0.5, 1], [1.5, 3], [2.5, 5]])
+
+    def test_datetime_values(self):
+        values = self.fdf.values
+        self.assertEqual(values[0, 4], self.pdf['t'][0])
+        self.assertEqual(self.fdf[1][4], self.pdf['t'][1])
+        self.assertEqual(self.fdf.loc[2].data[4], self.pdf['t'][2])
+
+    def test_add_column_to_homogeneous(self):
+        frame = fdf(np.random.rand(10, 2), ['x', 'y'])
+        frame['flag'] = np.ones(10, dtype=bool)
+        frame['z'] = np.zeros(10)
+        self.assertEqual(len(frame.blocks), 2)
+        self.assertEqual(frame.column_names, ['x', 'y', 'flag', 'z'])
+        self.assertEqual(frame['flag'].dtype, bool)
+        np.testing.assert_array_equal(frame.data[:, 3], np.zeros(10))
+
+    def test_save_open(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'mixed.fdf')
+            self.fdf.save(path)
+            mapped = fdf.open(path)
+            self.assertEqual(mapped.column_names, self.fdf.column_names)
+            for name in self.fdf.column_names:
+                self.assertEqual(mapped[name].dtype, self.fdf[name].dtype)
+                np.testing.assert_array_equal(mapped[name], self.fdf[name])
+
+class TestIndex(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        self.n = 1000
+        self.ts = np.datetime64('2024-01-01T00:00', 'ns') + np.cumsum(rng.integers(1, 60, self.n)).astype('timedelta64[s]')
+        self.values = rng.random((self.n, 2))
+        self.fdf = fdf.from_dict({'ts': self.ts, 'a': self.values[:, 0], 'b': self.values[:, 1]})
+        self.fdf.set_index('ts')
+        self.pdf = pd.DataFrame({'a': self.values[:, 0], 'b': self.values[:, 1]}, index=self.ts)
+
+    def test_range_lookup(self):
+        t0, t1 = self.ts[100], self.ts[200]
+        view = self.fdf.loc[t0:t1]
+        np.testing.assert_array_equal(view['a'], self.pdf.loc[t0:t1, 'a'])
+        np.testing.assert_array_equal(view.index, self.ts[100:201])
+        self.assertTrue(np.shares_memory(view['a'], self.fdf['a']))
+        between = self.ts[100] + np.timedelta64(1, 'ns')
+        self.assertEqual(len(self.fdf.loc[between:t1]), 100)
+        self.assertEqual(len(self.fdf.loc['2000-01-01':'2001-01-01']), 0)
+        nested = view.loc[self.ts[150]:]
+        np.testing.assert_array_equal(nested['b'], self.values[150:201, 1])
+
+    def test_label_lookup(self):
+        row = self.fdf.loc[self.ts[10]]
+        self.assertEqual(row['a'], self.values[10, 0])
+        gathered = self.fdf.loc[[self.ts[5], self.ts[7], self.ts[900]]]
+        np.testing.assert_array_equal(gathered['b'], self.values[[5, 7, 900], 1])
+        np.testing.assert_array_equal(gathered.index, self.ts[[5, 7, 900]])
+        with self.assertRaises(KeyError):
+            self.fdf.loc[self.ts[10] + np.timedelta64(1, 'ns')]
+
+    def test_asof(self):
+        self.assertIsNone(self.fdf.asof(self.ts[0] - np.timedelta64(1, 's')))
+        self.assertEqual(self.fdf.asof(self.ts[42])['a'], self.values[42, 0])
+        self.assertEqual(self.fdf.asof(self.ts[42] + np.timedelta64(1, 'ns'))['a'], self.values[42, 0])
+        with self.assertRaises(ValueError):
+            fdf(np.zeros((2, 1)), ['x']).asof(0)
+
+    def test_merge_asof(self):
+        quotes = fdf.from_dict({'ts': self.ts[::3], 'bid': np.arange(len(self.ts[::3]), dtype=np.int64)})
+        quotes.set_index('ts')
+        trades = self.fdf.loc[self.ts[1]:]
+        merged = trades.merge_asof(quotes, tolerance=np.timedelta64(60, 's'))
+        expected = pd.merge_asof(pd.DataFrame({'ts': self.ts[1:], 'a': self.values[1:, 0]}),
+                                 pd.DataFrame({'ts': self.ts[::3], 'bid': np.arange(len(self.ts[::3]))}),
+                                 on='ts', tolerance=pd.Timedelta(60, 's'))
+        self.assertEqual(merged.column_names, ['ts', 'a', 'b', 'bid'])
+        self.assertEqual(merged.index_name, 'ts')
+        np.testing.assert_array_equal(merged['bid'], expected['bid'].to_numpy(dtype=float))
+
+    def test_append_keeps_index(self):
+        last = self.ts[-1]
+        self.fdf.append_rows({'ts': [last + np.timedelta64(1, 's')], 'a': [1.0], 'b': [2.0]})
+        self.assertEqual(self.fdf.loc[last + np.timedelta64(1, 's')]['b'], 2.0)
+        with self.assertRaises(ValueError):
+            self.fdf.append_rows({'ts': [last], 'a': [1.0], 'b': [2.0]})
+        self.assertEqual(len(self.fdf), self.n + 1)
+        with self.assertRaises(ValueError):
+            self.fdf['ts'] = self.ts[::-1]
+
+    def test_index_shared_block(self):
+        frame = fdf(np.column_stack([np.arange(100.0), np.random.rand(100)]), ['t', 'x'])
+        frame.set_index('t')
+        for i in range(100, 300):
+            frame.append_rows([float(i), 0.5])
+        self.assertEqual(len(frame.loc[150.0:249.0]), 100)
+        self.assertEqual(frame.loc[299.0]['x'], 0.5)
+        with self.assertRaises(ValueError):
+            fdf(np.array([[2.0], [1.0]]), ['t']).set_index('t')
+
+    def test_save_open(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'indexed.fdf')
+            self.fdf.save(path)
+            mapped = fdf.open(path)
+            self.assertEqual(mapped.index_name, 'ts')
+            np.testing.assert_array_equal(mapped.loc[self.ts[3]:self.ts[9]]['a'], self.values[3:10, 0])
+
+class TestParallel(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.data = rng.random((20000, 8))
+        self.data[rng.random((20000, 8)) < 0.1] = np.nan
+        self.data[:, 7] = np.nan
+        self.fdf = fdf(self.data, [f'c{i}' for i in range(8)])
+        self.saved = dict(options)
+        set_option('chunk_bytes', 16384)
+
+    def tearDown(self):
+        options.update(self.saved)
+
+    def test_equivalent(self):
+        with np.errstate(all='ignore'), warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            for name in ['mean', 'sum', 'min', 'max', 'any']:
+                for axis in [0, 1]:
+                    with self.subTest(reduction=name, axis=axis):
+                        np.testing.assert_allclose(getattr(self.fdf, name)(axis=axis, workers=4),
+                                                   getattr(self.fdf, name)(axis=axis, workers=1), rtol=1e-12)
+
+    def test_view_and_blocks(self):
+        view = self.fdf.loc[1234:15000]
+        np.testing.assert_allclose(view.sum(workers=3), view.sum(), rtol=1e-12)
+        mixed = fdf.from_dict({'i': np.arange(50000), 'f': np.linspace(0, 1, 50000), 'b': np.arange(50000) % 2 == 0})
+        np.testing.assert_allclose(mixed.mean(workers=4), mixed.mean(), rtol=1e-12)
+        np.testing.assert_array_equal(mixed.max(workers=4), mixed.max())
+
+    def test_float32_mean(self):
+        frame = fdf(self.data[:, :7].astype(np.float32), [f'c{i}' for i in range(7)])
+        self.assertEqual(frame.mean(workers=4).dtype, frame.mean(workers=1).dtype)
+        np.testing.assert_allclose(frame.mean(workers=4), frame.mean(workers=1), rtol=1e-5)
+
+    def test_concurrent_worker_counts(self):
+        from concurrent.futures import ThreadPoolExecutor
+        expected = self.fdf.sum()
+        with ThreadPoolExecutor(max_workers=4) as callers:
+            results = list(callers.map(lambda i: self.fdf.sum(workers=2 + i % 2), range(40)))
+        for result in results:
+            np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+    def test_global_option(self):
+        set_option('workers', 4)
+        np.testing.assert_allclose(self.fdf.mean()[:7], np.nanmean(self.data[:, :7], axis=0), rtol=1e-12)
+        with self.assertRaises(KeyError):
+            set_option('threads', 2)
+        with self.assertRaises(ValueError):
+            set_option('workers', 0)
+
+class TestGroupBy(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(4)
+        n = 5000
+        self.pdf = pd.DataFrame({
+            'key': rng.integers(0, 50, n),
+            'x': rng.random(n),
+            'y': rng.integers(-100, 100, n),
+            'flag': rng.random(n) > 0.3,
+        })
+        self.pdf.loc[::7, 'x'] = np.nan
+        self.fdf = fdf.from_pandas(self.pdf)
+
+    def test_agg(self):
+        result = self.fdf.groupby('key').agg({'x': 'sum', 'y': ['min', 'max', 'mean'], 'flag': 'count'})
+        expected = self.pdf.groupby('key').agg(x=('x', 'sum'), y_min=('y', 'min'), y_max=('y', 'max'),
+                                               y_mean=('y', 'mean'), flag=('flag', 'count'))
+        self.assertEqual(result.column_names, ['key', 'x', 'y_min', 'y_max', 'y_mean', 'flag'])
+        np.testing.assert_array_equal(result['key'], expected.index)
+        for name in expected.columns:
+            np.testing.assert_allclose(result[name], expected[name], err_msg=name)
+        self.assertEqual(result['y_min'].dtype, np.int64)
+        self.assertEqual(result.index_name, 'key')
+
+    def test_shortcuts(self):
+        grouped = self.fdf.loc[100:3999].groupby('key')
+        expected = self.pdf.iloc[100:4000].groupby('key')
+        for name in ['sum', 'mean', 'min', 'max', 'count']:
+            with self.subTest(aggregation=name):
+                result = getattr(grouped, name)()
+                np.testing.assert_allclose(result['x'], getattr(expected, name)()['x'])
+
+    def test_float32(self):
+        frame = fdf.from_dict({'key': self.pdf['key'].to_numpy(), 'x': self.pdf['x'].to_numpy(np.float32)})
+        expected = self.pdf.astype({'x': np.float32}).groupby('key')['x']
+        for name in ['sum', 'mean']:
+            with self.subTest(aggregation=name):
+                result = getattr(frame.groupby('key'), name)()['x']
+                self.assertEqual(result.dtype, np.float32)
+                np.testing.assert_allclose(result, getattr(expected, name)(), rtol=1e-5)
+
+    def test_nan_keys_and_missing_groups(self):
+        frame = fdf(np.array([[1.0, 1.0], [np.nan, 2.0], [1.0, np.nan], [3.0, np.nan], [np.nan, 5.0]]), ['k', 'v'])
+        result = frame.groupby('k').agg({'v': ['sum', 'mean', 'min', 'count']})
+        np.testing.assert_array_equal(result['k'], [1.0, 3.0])
+        np.testing.assert_array_equal(result['v_sum'], [1.0, 0.0])
+        np.testing.assert_array_equal(result['v_mean'], [1.0, np.nan])
+        np.testing.assert_array_equal(result['v_min'], [1.0, np.nan])
+        np.testing.assert_array_equal(result['v_count'], [1, 0])
+        np.testing.assert_array_equal(frame.groupby('k').codes, [0, -1, 0, 1, -1])
+
+    def test_codes_cached(self):
+        grouping = self.fdf.groupby('key').grouping
+        self.assertIs(self.fdf.groupby('key').grouping, grouping)
+        self.assertIsNot(self.fdf.loc[:99].groupby('key').grouping, grouping)
+        self.fdf['x'] = 0.0
+        self.assertIs(self.fdf.groupby('key').grouping, grouping)
+        self.fdf['key'] = np.zeros(len(self.fdf), dtype=np.int64)
+        regrouped = self.fdf.groupby('key')
+        self.assertIsNot(regrouped.grouping, grouping)
+        self.assertEqual(regrouped.ngroups, 1)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.fdf.groupby('key').agg({'x': 'median'})
+
+class TestRows(unittest.TestCase):
+    def setUp(self):
+        self.values = np.arange(300, dtype=float).reshape(100, 3)
+        self.fdf = fdf(self.values, ['a', 'b', 'c'])
+
+    def tearDown(self):
+        set_option('row_cache_size', 4096)
+
+    def test_row_cache_bounded(self):
+        set_option('row_cache_size', 10)
+        for i in range(len(self.fdf)):
+            self.assertEqual(self.fdf.loc[i]['b'], self.values[i, 1])
+        self.assertEqual(len(self.fdf.loc._row_cache), 10)
+        self.assertIs(self.fdf.loc[99], self.fdf.loc[99])
+        set_option('row_cache_size', 0)
+        self.fdf.loc._row_cache.clear()
+        self.fdf.loc[5]
+        self.assertEqual(len(self.fdf.loc._row_cache), 0)
+        with self.assertRaises(ValueError):
+            set_option('row_cache_size', -1)
+
+    def test_rows_have_slots(self):
+        self.assertFalse(hasattr(self.fdf.loc[0], '__dict__'))
+        mixed = fdf.from_dict({'i': np.arange(3), 'f': np.ones(3)})
+        self.assertFalse(hasattr(mixed.loc[0], '__dict__'))
+
+    def test_gather(self):
+        view = self.fdf.loc[10:49]
+        gathered = view.loc[[0, 5, -1]]
+        np.testing.assert_array_equal(gathered.values, self.values[[10, 15, 49]])
+        np.testing.assert_array_equal(view.loc[np.array([3, 1])]['c'], self.values[[13, 11], 2])
+        np.testing.assert_array_equal(view.loc[view['a'] > 120]['a'], self.values[41:50, 0])
+        self.assertEqual(view.loc[np.int64(2)]['a'], self.values[12, 0])
+        mixed = fdf.from_dict({'i': np.arange(5), 'f': np.arange(5) * 0.5})
+        self.assertEqual(list(mixed.loc[[4, 0]]['i']), [4, 0])
+
+    def test_rows_and_columns(self):
+        np.testing.assert_array_equal(self.fdf.loc[0:5, 'a'], self.values[0:6, 0])
+        np.testing.assert_array_equal(self.fdf.loc[1:3, 0], self.values[1:4, 0])
+        self.assertEqual(self.fdf.loc[7, 'c'], self.values[7, 2])
+        np.testing.assert_array_equal(self.fdf.loc[[2, 4], ['c', 'a']].values, self.values[[2, 4]][:, [2, 0]])
+        self.assertEqual(self.fdf.loc[-1, ['b', 'c']]['c'], self.values[-1, 2])
+        with self.assertRaises(TypeError):
+            self.fdf.loc[1, 2, 3]
+        with self.assertRaises(TypeError):
+            self.fdf.loc[1:2, 0.5]
+
+    def test_iterrows(self):
+        view = self.fdf.loc[5:94]
+        rows = list(view.iterrows(batch_size=7))
+        self.assertEqual(len(rows), 90)
+        np.testing.assert_array_equal([row['c'] for row in rows], self.values[5:95, 2])
+        np.testing.assert_array_equal(rows[-1].data, self.values[94])
+        self.assertEqual(len(self.fdf.loc._row_cache), 0)
+        mixed = fdf.from_dict({'i': np.arange(5), 'f': np.arange(5) * 0.5})
+        self.assertEqual([(row['i'], row['f']) for row in mixed.iterrows(batch_size=2)],
+                         [(i, i * 0.5) for i in range(5)])
+        with self.assertRaises(ValueError):
+            next(self.fdf.iterrows(batch_size=0))
+
+class TestLazy(unittest.TestCase):
+    def setUp(self):
+        self.values = np.random.rand(3000, 4)
+        self.values[np.random.rand(3000, 4) < 0.1] = np.nan
+        self.fdf = fdf(self.values, ['a', 'b', 'c', 'd'])
+        # Tiny chunks so every plan spans many of them.
+        set_option('chunk_bytes', 512)
+
+    def tearDown(self):
+        set_option('chunk_bytes', 1 << 20)
+
+    def assertFrameEqual(self, lazy, eager):
+        self.assertEqual(lazy.column_names, eager.column_names)
+        for name in eager.column_names:
+            self.assertEqual(lazy[name].dtype, eager[name].dtype)
+            np.testing.assert_array_equal(lazy[name], eager[name])
+
+    def test_matches_eager(self):
+        for periods in [0, 1, 7, -1, -40]:
+            with self.subTest(periods=periods):
+                lazy = self.fdf.lazy().shift(periods)
+                eager = self.fdf.shift(periods)
+                self.assertFrameEqual(lazy.collect(), eager)
+                self.assertFrameEqual(lazy.fillna(0).dropna().collect(), eager.fillna(0).dropna())
+                self.assertFrameEqual(lazy.dropna().shift(3).collect(), eager.dropna().shift(3))
+                np.testing.assert_allclose(lazy.fillna(0).mean().collect(), eager.fillna(0).mean())
+                np.testing.assert_allclose(lazy.dropna().sum().collect(), eager.dropna().sum())
+                np.testing.assert_array_equal(lazy.min().collect(), eager.min())
+                np.testing.assert_array_equal(lazy.max().collect(), eager.max())
+                np.testing.assert_array_equal(lazy.any().collect(), eager.any())
+
+    def test_matches_eager_mixed(self):
+        n = len(self.values)
+        frame = fdf.from_dict({
+            'i': np.arange(n),
+            'b': np.arange(n) % 3 == 0,
+            't': np.datetime64('2024-01-01', 'ns') + np.arange(n).astype('timedelta64[s]'),
+            'x': self.values[:, 0],
+        })
+        for periods in [0, 1, 7, -1, -40]:
+            with self.subTest(periods=periods):
+                lazy = frame.lazy().shift(periods)
+                eager = frame.shift(periods)
+                self.assertFrameEqual(lazy.collect(), eager)
+                self.assertFrameEqual(lazy.dropna().collect(), eager.dropna())
+                self.assertFrameEqual(frame.lazy().loc[10:500].shift(periods, fill_value=0).collect(),
+                                      frame.loc[10:500].shift(periods, fill_value=0))
+
+    def test_slices_pushed_down(self):
+        for periods in [2, -2]:
+            with self.subTest(periods=periods):
+                lazy = self.fdf.lazy().shift(periods)
+                eager = self.fdf.shift(periods)
+                self.assertFrameEqual(lazy.loc[100:200].collect(), eager.loc[100:200])
+                self.assertFrameEqual(lazy.loc[:0].collect(), eager.loc[:0])
+                self.assertFrameEqual(lazy.loc[-5:].collect(), eager.loc[-5:])
+                self.assertFrameEqual(self.fdf.loc[500:999].lazy().shift(periods).loc[10:20].shift(-1).collect(),
+                                      self.fdf.loc[500:999].shift(periods).loc[10:20].shift(-1))
+        self.assertEqual(len(self.fdf.lazy().shift(1).loc[100:200]), 101)
+        self.assertEqual(self.fdf.lazy().shift(5).loc[100:200]._source_range(), (95, 201))
+        with self.assertRaises(ValueError):
+            self.fdf.lazy().dropna().loc[:10]
+
+    def test_mixed_blocks_and_index(self):
+        pdf = pd.DataFrame({
+            't': pd.date_range('2024-01-01', periods=500, freq='s'),
+            'i': np.arange(500),
+            'x': np.where(np.arange(500) % 7 == 0, np.nan, 1.5),
+        })
+        frame = fdf.from_pandas(pdf)
+        frame.set_index('t')
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', DeprecationWarning)
+            result = frame.lazy().loc[pdf['t'][10]:pdf['t'][99]].shift(-3).dropna().collect()
+        self.assertEqual(frame.lazy().shift(1).collect()['t'].dtype, pdf['t'].dtype)
+        expected = pdf.iloc[10:100].set_index('t', drop=False).shift(-3).dropna()
+        np.testing.assert_array_equal(result.index, expected.index)
+        np.testing.assert_array_equal(result['i'], expected['i'])
+        np.testing.assert_array_equal(result['t'], expected['t'])
+        np.testing.assert_array_equal(frame.lazy().fillna(0).collect()['x'], pdf['x'].fillna(0))
+        with self.assertRaises(TypeError):
+            frame.lazy().mean().collect()
+
+class TestInterop(unittest.TestCase):
+    def setUp(self):
+        self.values = np.random.rand(100, 3)
+        self.fdf = fdf(self.values, ['a', 'b', 'c'])
+        self.mixed = fdf.from_dict({'i': np.arange(100), 'x': np.random.rand(100), 'y': np.random.rand(100)})
+
+    def test_pandas_round_trip(self):
+        pdf = self.fdf.loc[10:59].to_pandas()
+        self.assertTrue(np.shares_memory(pdf.to_numpy(), self.values))
+        np.testing.assert_array_equal(pdf.to_numpy(), self.values[10:60])
+        back = fdf.from_pandas(pdf)
+        self.assertTrue(np.shares_memory(back.data, self.values))
+        mixed = self.mixed.to_pandas(copy=False)
+        self.assertEqual(list(mixed.columns), ['i', 'x', 'y'])
+        np.testing.assert_array_equal(mixed['i'], self.mixed['i'])
+        self.assertFalse(np.shares_memory(self.fdf.to_pandas(copy=True).to_numpy(), self.values))
+        # Exports that copied leave the frame writing in place.
+        values = np.random.rand(10, 3)
+        frame = fdf(values, ['a', 'b', 'c'])
+        frame.to_pandas(copy=True)
+        np.asarray(frame, dtype=np.float32)
+        frame['a'] = 0.0
+        self.assertTrue(np.shares_memory(frame.data, values))
+
+    def test_exports_unaffected_by_writes(self):
+        pdf = self.fdf.to_pandas()
+        array = np.asarray(self.fdf.loc[0:9])
+        self.fdf['a'] = -1.0
+        np.testing.assert_array_equal(pdf['a'], self.values[:, 0])
+        np.testing.assert_array_equal(array[:, 0], self.values[:10, 0])
+        np.testing.assert_array_equal(self.fdf['a'], -1.0)
+        self.assertFalse(np.shares_memory(self.fdf.data, self.values))
+        # Only the first write copies; the frame owns the new buffer.
+        block = self.fdf.blocks[0]
+        self.fdf['b'] = -2.0
+        self.assertIs(self.fdf.blocks[0], block)
+
+    def test_from_pandas_copy_flag(self):
+        pdf = pd.DataFrame({'x': np.arange(5.0), 'i': np.arange(5), 'y': np.ones(5)})
+        copied = fdf.from_pandas(pdf)
+        self.assertEqual(len(copied.blocks), 2)
+        shared = fdf.from_pandas(pdf, copy=False)
+        self.assertEqual(len(shared.blocks), 3)
+        self.assertTrue(np.shares_memory(shared['x'], pdf['x'].to_numpy()))
+        # Writes never reach the pandas frame; a shared block is copied first.
+        shared['x'] = 7.0
+        np.testing.assert_array_equal(shared['x'], 7.0)
+        np.testing.assert_array_equal(pdf['x'], np.arange(5.0))
+        values = np.arange(6.0).reshape(3, 2)
+        source = pd.DataFrame(values, columns=['a', 'b'], copy=False)
+        frame = fdf.from_pandas(source)
+        frame['a'] = 0.0
+        np.testing.assert_array_equal(source['a'], [0.0, 2.0, 4.0])
+        np.testing.assert_array_equal(values[:, 0], [0.0, 2.0, 4.0])
+        with self.assertRaises(ValueError):
+            fdf.from_pandas(pd.DataFrame({'s': pd.array([1, None], dtype='Int64')}), copy=False)
+
+    def test_array_and_dlpack(self):
+        view = self.fdf.loc[5:9]
+        self.assertTrue(np.shares_memory(np.asarray(view), self.values))
+        np.testing.assert_array_equal(np.from_dlpack(view), self.values[5:10])
+        self.assertEqual(np.asarray(view, dtype=np.float32).dtype, np.float32)
+        np.testing.assert_array_equal(np.asarray(self.mixed)[:, 0], np.arange(100))
+        with self.assertRaises(ValueError):
+            self.mixed.__array__(copy=False)
+        with self.assertRaises(ValueError):
+            view.__array__(np.float32, copy=False)
+        self.assertFalse(np.shares_memory(view.__array__(copy=True), self.values))
+
+    @unittest.skipIf(pa is None, "pyarrow is not installed")
+    def test_arrow(self):
+        table = pa.table({'x': np.arange(5.0), 'i': np.arange(5), 'n': pa.array([1, None, 3, 4, 5])})
+        frame = fdf.from_arrow(table)
+        np.testing.assert_array_equal(frame['n'], [1, np.nan, 3, 4, 5])
+        with self.assertRaises(ValueError):
+            fdf.from_arrow(table, copy=False)
+        shared = fdf.from_arrow(table.select(['x', 'i']), copy=False)
+        self.assertTrue(np.shares_memory(shared['x'], table.column('x').chunk(0).to_numpy()))
+        batch = fdf.from_arrow(pa.record_batch({'a': np.arange(3.0)}))
+        np.testing.assert_array_equal(batch['a'], [0.0, 1.0, 2.0])
+        exported = self.mixed.to_arrow()
+        self.assertEqual(exported.column_names, ['i', 'x', 'y'])
+        np.testing.assert_array_equal(exported.column('y').to_numpy(), self.mixed['y'])
+        with self.assertRaises(ValueError):
+            self.fdf.to_arrow(copy=False)
+        # Strided columns were copied, so the frame keeps writing in place.
+        self.fdf.to_arrow()
+        block = self.fdf.blocks[0]
+        self.fdf['a'] = 0.0
+        self.assertIs(self.fdf.blocks[0], block)
+        single = fdf.from_dict({'f': np.arange(4.0)}, copy=None)
+        exported = single.to_arrow(copy=False)
+        self.assertTrue(np.shares_memory(exported.column('f').chunk(0).to_numpy(), single.data))
+        single['f'] = 9.0
+        np.testing.assert_array_equal(exported.column('f').to_numpy(), np.arange(4.0))
+
+class TestStats(unittest.TestCase):
+    def setUp(self):
+        self.values = np.random.rand(20000, 3)
+        self.values[np.random.rand(20000, 3) < 0.05] = np.nan
+        self.plain = fdf(self.values, ['a', 'b', 'c'])
+        self.fdf = fdf(self.values.copy(), ['a', 'b', 'c'])
+        self.fdf.cache_stats()
+
+    def test_range_reductions(self):
+        for start, stop in [(0, 19999), (5, 17), (4095, 4096), (100, 15000), (8191, 12289)]:
+            for name in ['sum', 'mean', 'min', 'max']:
+                with self.subTest(start=start, stop=stop, reduction=name):
+                    expected = getattr(self.plain.loc[start:stop], name)()
+                    result = getattr(self.fdf.loc[start:stop], name)()
+                    np.testing.assert_allclose(result, expected, rtol=1e-10)
+                    self.assertEqual(result.dtype, expected.dtype)
+        self.assertEqual({key for key in self.fdf._cache if key[0] == 'stats'},
+                         {('stats', 'a'), ('stats', 'b'), ('stats', 'c')})
+
+    def test_mixed_blocks(self):
+        columns = {
+            'i': np.arange(10000, dtype=np.int32),
+            'x': self.values[:10000, 0],
+            'flag': self.values[:10000, 1] > 0.5,
+        }
+        plain = fdf.from_dict(columns)
+        cached = fdf.from_dict(columns)
+        cached.cache_stats()
+        for name in ['sum', 'mean', 'min', 'max']:
+            with self.subTest(reduction=name):
+                expected = getattr(plain.loc[3:7000], name)()
+                result = getattr(cached.loc[3:7000], name)()
+                np.testing.assert_allclose(result.astype(float), expected.astype(float), rtol=1e-10)
+        # Blocks the cache does not cover fall back to a scan.
+        cached.add_column('t', np.arange(10000).astype('datetime64[s]'))
+        self.assertEqual(cached.loc[3:7000].max()[3], np.datetime64(7000, 's'))
+        self.assertEqual(cached.loc[3:7000].min()[0], 3)
+
+    def test_invalidation(self):
+        self.fdf.loc[10:20].sum()
+        stats_b = self.fdf._cache[('stats', 'b')]
+        self.fdf['a'] = 1.0
+        self.assertNotIn(('stats', 'a'), self.fdf._cache)
+        self.assertIs(self.fdf._cache[('stats', 'b')], stats_b)
+        self.assertEqual(self.fdf.loc[10:20].sum()[0], 11.0)
+        self.fdf.append_rows([[5.0, 5.0, 5.0]])
+        self.assertEqual(self.fdf.loc[-1:].max()[2], 5.0)
+        # Views from before an append must not leave short statistics in the shared cache.
+        view = self.fdf.loc[0:4]
+        self.fdf.append_rows(np.ones((5000, 3)))
+        np.testing.assert_allclose(view.sum(), np.nansum(self.fdf.values[:5], axis=0))
+        np.testing.assert_allclose(self.fdf.sum(), np.nansum(self.fdf.values, axis=0))
+        self.fdf.cache_stats(False)
+        self.assertFalse(any(key[0] == 'stats' for key in self.fdf._cache))
+
+    def test_non_finite_and_large_values(self):
+        frame = fdf(np.array([[np.inf, 1.0, 2.0, -np.inf, 3.0]]).T, ['a'])
+        frame.cache_stats()
+        self.assertEqual(frame.loc[1:2].sum()[0], 3.0)
+        self.assertEqual(frame.loc[1:2].mean()[0], 1.5)
+        self.assertEqual(frame.loc[0:2].sum()[0], np.inf)
+        self.assertEqual(frame.loc[3:4].sum()[0], -np.inf)
+        with np.errstate(invalid='ignore'):
+            self.assertTrue(np.isnan(frame.loc[0:4].sum()[0]))
+        large = fdf(np.array([[1e20, 1.0, 2.0, 3.0]]).T, ['a'])
+        large.cache_stats()
+        self.assertEqual(large.loc[1:3].sum()[0], 6.0)
+        self.assertEqual(large.loc[1:3].mean()[0], 2.0)
+
+class TestReaders(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.values = np.random.rand(1000, 3)
+        self.values[::9, 1] = np.nan
+        self.csv = os.path.join(self.directory.name, 'data.csv')
+        pd.DataFrame(self.values, columns=['a', 'b', 'c']).to_csv(self.csv, index=False)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_read_csv(self):
+        frame = fdf.read_csv(self.csv, chunksize=64)
+        self.assertEqual(frame.column_names, ['a', 'b', 'c'])
+        np.testing.assert_array_equal(frame.values, pd.read_csv(self.csv).to_numpy())
+        self.assertGreaterEqual(frame.capacity, len(frame))
+        subset = fdf.read_csv(self.csv, columns=['c', 'a'], dtype=np.float32)
+        self.assertEqual(subset.column_names, ['a', 'c'])
+        self.assertEqual(subset.data.dtype, np.float32)
+
+    def test_read_csv_chunks(self):
+        chunks = list(fdf.read_csv(self.csv, chunksize=300, iterator=True))
+        self.assertEqual([len(chunk) for chunk in chunks], [300, 300, 300, 100])
+        np.testing.assert_allclose(np.concatenate([chunk['c'] for chunk in chunks]), self.values[:, 2])
+        empty = os.path.join(self.directory.name, 'empty.csv')
+        with open(empty, 'w') as f:
+            f.write('x,y\n')
+        frame = fdf.read_csv(empty)
+        self.assertEqual((len(frame), frame.column_names), (0, ['x', 'y']))
+
+    def test_read_binary(self):
+        path = os.path.join(self.directory.name, 'data.bin')
+        with open(path, 'wb') as f:
+            f.write(b'header!!')
+            self.values.tofile(f)
+        frame = fdf.read_binary(path, ['a', 'b', 'c'], offset=8)
+        np.testing.assert_array_equal(frame.values, self.values)
+        chunks = list(fdf.read_binary(path, ['a', 'b', 'c'], offset=8, chunksize=400, iterator=True))
+        self.assertEqual([len(chunk) for chunk in chunks], [400, 400, 200])
+        np.testing.assert_array_equal(chunks[-1]['b'], self.values[800:, 1])
+        with self.assertRaises(ValueError):
+            fdf.read_binary(path, ['a', 'b', 'c'], offset=9)
+
+class TestProfile(unittest.TestCase):
+    def setUp(self):
+        values = np.random.rand(1000, 4)
+        values[::7, 1] = np.nan
+        self.fdf = fdf(values, ['a', 'b', 'c', 'd'])
+        core.reset_profile()
+
+    def tearDown(self):
+        set_option('profile', False)
+        core.reset_profile()
+
+    def test_views_and_copies(self):
+        set_option('profile', True)
+        self.fdf.loc[10:20]
+        self.fdf.loc[5]
+        mask = self.fdf['a'] > 0.5
+        selected = self.fdf[mask]
+        self.fdf.dropna()
+        profile = core.get_profile()
+        self.assertEqual(profile['LocIndexer.__getitem__']['views'], 2)
+        self.assertEqual(profile['LocIndexer.__getitem__']['bytes'], 0)
+        getitem = profile['FastDataFrameView.__getitem__']
+        self.assertEqual((getitem['calls'], getitem['views'], getitem['copies']), (2, 1, 1))
+        self.assertEqual(getitem['bytes'], selected.values.nbytes)
+        # isna inside dropna is not recorded on its own.
+        self.assertEqual(profile['FastDataFrameView.dropna']['copies'], 1)
+        self.assertNotIn('FastDataFrameView.isna', profile)
+
+    def test_reallocation_counted(self):
+        set_option('profile', True)
+        self.fdf['a'] = 0.0
+        self.fdf.append_rows(np.ones((1, 4)))
+        profile = core.get_profile()
+        self.assertEqual(profile['FastDataFrame.__setitem__']['copies'], 0)
+        self.assertEqual(profile['FastDataFrame.append_rows']['copies'], 1)
+        self.assertGreater(profile['FastDataFrame.append_rows']['seconds'], 0)
+
+    def test_concurrent_callers(self):
+        from concurrent.futures import ThreadPoolExecutor
+        set_option('profile', True)
+        with ThreadPoolExecutor(max_workers=4) as callers:
+            list(callers.map(lambda i: self.fdf.dropna(), range(200)))
+        profile = core.get_profile()
+        self.assertEqual(profile['FastDataFrameView.dropna']['calls'], 200)
+        self.assertNotIn('FastDataFrameView.isna', profile)
+
+    def test_disabled_by_default(self):
+        method = core.FastDataFrameView.__dict__['shift']
+        set_option('profile', True)
+        self.assertIsNot(core.FastDataFrameView.__dict__['shift'], method)
+        set_option('profile', False)
+        self.assertIs(core.FastDataFrameView.__dict__['shift'], method)
+        self.fdf.shift(1)
+        self.assertEqual(core.get_profile(), {})
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)